@@ -16,15 +16,28 @@ import warnings
 warnings.filterwarnings("ignore", category=FutureWarning, module="google.api_core._python_version_support")
 
 import google.generativeai as genai
+import glob
+import gzip
 import json
 import os
+import shutil
 import sys
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 import hashlib
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, List, Tuple
 import textwrap
 
+# Stateless (no chat history) response cache
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 3600  # seconds
+
+# Daily usage logs older than this are gzipped
+USAGE_LOG_ARCHIVE_DAYS = 30
+
 class GeminiGateway:
     """Gemini AI Gateway for amateur radio BBS"""
     
@@ -32,12 +45,14 @@ class GeminiGateway:
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.config_path = os.path.join(self.script_dir, config_file)
         self.users_db_path = os.path.join(self.script_dir, "gemini_users.json")
-        self.usage_log_path = os.path.join(self.script_dir, "gemini_usage.json")
+        self.usage_log_prefix = os.path.join(self.script_dir, "gemini_usage_")
         
         self.config = self.load_config()
         self.users_db = self.load_users_db()
         self.usage_log = self.load_usage_log()
         
+        threading.Thread(target=self.archive_usage_logs, daemon=True).start()
+        
         # Current session state
         self.current_user = None
         self.current_api_key = None
@@ -45,9 +60,35 @@ class GeminiGateway:
         self.temp_key_mode = False
         self.chat_session = None
         
+        # Local tokenizer, resolved on first use (False = not available)
+        self._tokenizer = None
+        
+        # Per-user [hour_count, day_count] from the last full usage scan,
+        # bumped by log_query; entries only age out, so these are upper bounds
+        self._known_counts = {}
+        
+        # key digest -> (timestamp, response text), LRU ordered
+        self._resp_cache = OrderedDict()
+        
         # RF optimization settings
         self.max_line_length = 79
         self.page_size = 20
+        
+        # Command dispatch tables: exact matches, then "PREFIX <args>" forms
+        self._exact_cmds = {
+            "HELP": self.show_help,
+            "STATUS": self.show_status,
+            "HISTORY": self._cmd_history,
+            "CLEAR": self.clear_history,
+            "LOGOUT": self._cmd_logout,
+            "REGISTER": self._cmd_register,
+            "CLEARKEY": self._cmd_clearkey,
+        }
+        self._prefix_cmds = [
+            ("LOGIN ", self._cmd_login),
+            ("TEMPKEY ", self._cmd_tempkey),
+            ("ASK ", self._cmd_ask),
+        ]
     
     def load_config(self):
         """Load configuration from JSON file"""
@@ -123,24 +164,61 @@ class GeminiGateway:
         except Exception as e:
             print(f"Error saving users database: {e}")
     
+    def usage_log_file(self, day):
+        """Path of the JSONL usage log for a given date"""
+        return f"{self.usage_log_prefix}{day:%Y%m%d}.jsonl"
+    
     def load_usage_log(self):
-        """Load usage statistics"""
-        try:
-            with open(self.usage_log_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return {"sessions": []}
-        except json.JSONDecodeError:
-            return {"sessions": []}
+        """Load the last 24h of usage statistics (today's and yesterday's logs)"""
+        day_ago = (datetime.now() - timedelta(days=1)).isoformat()
+        sessions = []
+        
+        for day in (datetime.now() - timedelta(days=1), datetime.now()):
+            try:
+                with open(self.usage_log_file(day), 'r') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if entry.get("timestamp", "") > day_ago:
+                            sessions.append(entry)
+            except FileNotFoundError:
+                continue
+        
+        return {"sessions": sessions}
     
-    def save_usage_log(self):
-        """Save usage statistics"""
+    def append_usage_log(self, log_entry):
+        """Append one entry to today's usage log"""
         try:
-            with open(self.usage_log_path, 'w') as f:
-                json.dump(self.usage_log, f, indent=4)
+            with open(self.usage_log_file(datetime.now()), 'a') as f:
+                f.write(json.dumps(log_entry) + "\n")
         except Exception as e:
             print(f"Error saving usage log: {e}")
     
+    def archive_usage_logs(self):
+        """Gzip daily usage logs older than USAGE_LOG_ARCHIVE_DAYS"""
+        cutoff = f"{self.usage_log_prefix}{datetime.now() - timedelta(days=USAGE_LOG_ARCHIVE_DAYS):%Y%m%d}.jsonl"
+        
+        for path in glob.glob(f"{self.usage_log_prefix}????????.jsonl"):
+            if path >= cutoff:
+                continue
+            try:
+                with open(path, 'rb') as src, gzip.open(path + ".gz", 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+            except Exception as e:
+                print(f"Error archiving usage log {path}: {e}")
+                # Don't leave a truncated archive next to the original
+                try:
+                    os.remove(path + ".gz")
+                except OSError:
+                    pass
+                continue
+            try:
+                os.remove(path)
+            except Exception as e:
+                print(f"Error archiving usage log {path}: {e}")
+    
     def hash_password(self, password):
         """Simple password hashing"""
         return hashlib.sha256(password.encode()).hexdigest()
@@ -186,6 +264,14 @@ class GeminiGateway:
         else:
             limits = self.config["temp_key_limits"]
         
+        # Fast path: comfortably within budget, no need to rescan the log
+        counts = self._known_counts.get(self.current_user)
+        if counts:
+            hour_count, day_count = counts
+            if ((hour_count + 1) * 2 <= limits["queries_per_hour"] and
+                    (day_count + 1) * 2 <= limits["queries_per_day"]):
+                return True, f"OK - {hour_count}/{limits['queries_per_hour']} this hour, {day_count}/{limits['queries_per_day']} today"
+        
         hour_ago = now - timedelta(hours=1)
         day_ago = now - timedelta(days=1)
         
@@ -203,6 +289,8 @@ class GeminiGateway:
             if timestamp > day_ago:
                 day_count += 1
         
+        self._known_counts[self.current_user] = [hour_count, day_count]
+        
         if hour_count >= limits["queries_per_hour"]:
             return False, f"Rate limit exceeded: {limits['queries_per_hour']} queries per hour"
         
@@ -223,13 +311,31 @@ class GeminiGateway:
         }
         
         self.usage_log["sessions"].append(log_entry)
+        self.append_usage_log(log_entry)
+        
+        # Anonymous scans count every session, so bump that entry too
+        for key in {self.current_user, None}:
+            if key in self._known_counts:
+                self._known_counts[key][0] += 1
+                self._known_counts[key][1] += 1
         
         if self.current_user and self.current_user in self.users_db:
             self.users_db[self.current_user]["total_queries"] += 1
             self.users_db[self.current_user]["last_used"] = datetime.now().isoformat()
             self.save_users_db()
-        
-        self.save_usage_log()
+    
+    def count_tokens(self, text):
+        """Estimate token count locally without an API round-trip"""
+        if self._tokenizer is None:
+            try:
+                import tiktoken
+                self._tokenizer = tiktoken.get_encoding("cl100k_base")
+            except Exception:
+                self._tokenizer = False
+        
+        if self._tokenizer:
+            return len(self._tokenizer.encode(text, disallowed_special=()))
+        return len(text) // 4
     
     def format_for_rf(self, text):
         """Format text for RF transmission with line wrapping"""
@@ -285,6 +391,18 @@ class GeminiGateway:
         
         return safety_settings if safety_settings else None
     
+    def _response_cache_key(self, user_message, max_tokens):
+        """Cache key for a stateless query"""
+        # max_tokens is part of the key: an answer cut short at one tier's
+        # limit must not be handed to a tier allowed a longer one
+        key = "|".join((
+            user_message.strip().lower(),
+            self.config["model"],
+            self.config.get("system_instruction", ""),
+            str(max_tokens)
+        ))
+        return hashlib.blake2b(key.encode(), digest_size=16).digest()
+    
     def query_gemini(self, user_message, use_history=True):
         """Send query to Gemini and get response"""
         
@@ -306,13 +424,6 @@ class GeminiGateway:
             api_key = self.config["default_api_key"]
             user_type = "default"
         
-        if not api_key:
-            return "ERROR: No API key configured", 0
-        
-        can_query, limit_msg = self.check_rate_limit(user_type)
-        if not can_query:
-            return f"ERROR: {limit_msg}", 0
-        
         if user_type == "default":
             max_tokens = self.config["default_key_limits"]["max_tokens_per_query"]
         elif user_type == "registered":
@@ -320,6 +431,25 @@ class GeminiGateway:
         else:
             max_tokens = self.config["temp_key_limits"]["max_tokens_per_query"]
         
+        # Answers inside a chat session depend on its history, don't cache
+        # those; with conversation history enabled (the default) nothing
+        # is cached
+        use_chat = use_history and self.config["enable_conversation_history"]
+        cache_key = None
+        if not use_chat:
+            cache_key = self._response_cache_key(user_message, max_tokens)
+            cached = self._resp_cache.get(cache_key)
+            if cached and time.time() - cached[0] < RESPONSE_CACHE_TTL:
+                self._resp_cache.move_to_end(cache_key)
+                return cached[1] + "\n(cached)", 0
+        
+        if not api_key:
+            return "ERROR: No API key configured", 0
+        
+        can_query, limit_msg = self.check_rate_limit(user_type)
+        if not can_query:
+            return f"ERROR: {limit_msg}", 0
+        
         try:
             self.configure_gemini(api_key)
             
@@ -340,7 +470,7 @@ class GeminiGateway:
                 system_instruction=system_instruction
             )
             
-            if use_history and self.config["enable_conversation_history"]:
+            if use_chat:
                 if not self.chat_session:
                     self.chat_session = model.start_chat(history=[])
                 response = self.chat_session.send_message(user_message)
@@ -348,10 +478,16 @@ class GeminiGateway:
                 response = model.generate_content(user_message)
             
             response_text = response.text
-            tokens_used = (len(user_message) + len(response_text)) // 4
+            tokens_used = self.count_tokens(user_message) + self.count_tokens(response_text)
             
             self.log_query(user_message, response_text, tokens_used)
             
+            if cache_key is not None:
+                self._resp_cache[cache_key] = (time.time(), response_text)
+                self._resp_cache.move_to_end(cache_key)
+                if len(self._resp_cache) > RESPONSE_CACHE_SIZE:
+                    self._resp_cache.popitem(last=False)
+            
             return response_text, tokens_used
             
         except Exception as e:
@@ -451,6 +587,95 @@ For emergency communications use only.
         """)
         print("=" * 60)
     
+    def _cmd_history(self):
+        """HISTORY command"""
+        if self.chat_session:
+            print("Active chat session with conversation history")
+            print("Use CLEAR to start fresh conversation")
+        else:
+            print("No active chat session")
+    
+    def _cmd_login(self, args):
+        """LOGIN <callsign> <password> command"""
+        parts = args.strip().split(None, 1)
+        if len(parts) != 2:
+            print("Usage: LOGIN <callsign> <password>")
+            return
+        
+        callsign, password = parts
+        if self.authenticate_user(callsign, password):
+            self.current_user = callsign.upper()
+            self.temp_key_mode = False
+            print(f"Logged in as {self.current_user}")
+        else:
+            print("Authentication failed")
+    
+    def _cmd_logout(self):
+        """LOGOUT command"""
+        if self.temp_key_mode:
+            self.current_api_key = None
+            self.temp_key_mode = False
+            print("Temporary key cleared")
+        self.current_user = None
+        self.clear_history()
+        print("Logged out")
+    
+    def _cmd_register(self):
+        """REGISTER command (interactive)"""
+        print("\n--- User Registration ---")
+        callsign = input("Callsign: ").strip().upper()
+        password = input("Password: ").strip()
+        
+        has_key = input("Do you have your own Gemini API key? (y/n): ").strip().lower()
+        api_key = None
+        if has_key == 'y':
+            api_key = input("Enter your API key: ").strip()
+        
+        self.register_user(callsign, password, api_key)
+    
+    def _cmd_tempkey(self, args):
+        """TEMPKEY <key> command"""
+        api_key = args.strip()
+        if len(api_key) < 20:
+            print("Invalid API key format")
+        else:
+            self.current_api_key = api_key
+            self.temp_key_mode = True
+            print("Temporary API key set for this session")
+            print("Key will be cleared when you logout")
+    
+    def _cmd_clearkey(self):
+        """CLEARKEY command"""
+        self.current_api_key = None
+        self.temp_key_mode = False
+        print("Temporary key cleared")
+    
+    def _cmd_ask(self, args):
+        """ASK <question> command"""
+        question = args.strip()
+        if not question:
+            print("Usage: ASK <your question>")
+            return
+        
+        print("\nQuerying Gemini AI...")
+        print("-" * 60)
+        
+        response, tokens = self.query_gemini(question)
+        
+        lines = self.format_for_rf(response)
+        
+        line_count = 0
+        for line in lines:
+            print(line)
+            line_count += 1
+            
+            if line_count >= self.page_size and line_count < len(lines) - 1:
+                input("\n[Press ENTER to continue...]")
+                line_count = 0
+        
+        print("-" * 60)
+        print(f"Estimated tokens: {tokens}")
+    
     def run_interactive(self):
         """Main interactive console"""
         print("=" * 60)
@@ -480,96 +705,15 @@ For emergency communications use only.
                     print("73! Gateway closing...")
                     break
                 
-                elif cmd_upper == 'HELP':
-                    self.show_help()
-                
-                elif cmd_upper == 'STATUS':
-                    self.show_status()
-                
-                elif cmd_upper == 'HISTORY':
-                    if self.chat_session:
-                        print("Active chat session with conversation history")
-                        print("Use CLEAR to start fresh conversation")
-                    else:
-                        print("No active chat session")
-                
-                elif cmd_upper == 'CLEAR':
-                    self.clear_history()
-                
-                elif cmd_upper.startswith('LOGIN '):
-                    parts = command[6:].strip().split(None, 1)
-                    if len(parts) != 2:
-                        print("Usage: LOGIN <callsign> <password>")
-                    else:
-                        callsign, password = parts
-                        if self.authenticate_user(callsign, password):
-                            self.current_user = callsign.upper()
-                            self.temp_key_mode = False
-                            print(f"Logged in as {self.current_user}")
-                        else:
-                            print("Authentication failed")
-                
-                elif cmd_upper == 'LOGOUT':
-                    if self.temp_key_mode:
-                        self.current_api_key = None
-                        self.temp_key_mode = False
-                        print("Temporary key cleared")
-                    self.current_user = None
-                    self.clear_history()
-                    print("Logged out")
-                
-                elif cmd_upper == 'REGISTER':
-                    print("\n--- User Registration ---")
-                    callsign = input("Callsign: ").strip().upper()
-                    password = input("Password: ").strip()
-                    
-                    has_key = input("Do you have your own Gemini API key? (y/n): ").strip().lower()
-                    api_key = None
-                    if has_key == 'y':
-                        api_key = input("Enter your API key: ").strip()
-                    
-                    self.register_user(callsign, password, api_key)
-                
-                elif cmd_upper.startswith('TEMPKEY '):
-                    api_key = command[8:].strip()
-                    if len(api_key) < 20:
-                        print("Invalid API key format")
-                    else:
-                        self.current_api_key = api_key
-                        self.temp_key_mode = True
-                        print("Temporary API key set for this session")
-                        print("Key will be cleared when you logout")
-                
-                elif cmd_upper == 'CLEARKEY':
-                    self.current_api_key = None
-                    self.temp_key_mode = False
-                    print("Temporary key cleared")
-                
-                elif cmd_upper.startswith('ASK '):
-                    question = command[4:].strip()
-                    if not question:
-                        print("Usage: ASK <your question>")
-                        continue
-                    
-                    print("\nQuerying Gemini AI...")
-                    print("-" * 60)
-                    
-                    response, tokens = self.query_gemini(question)
-                    
-                    lines = self.format_for_rf(response)
-                    
-                    line_count = 0
-                    for line in lines:
-                        print(line)
-                        line_count += 1
-                        
-                        if line_count >= self.page_size and line_count < len(lines) - 1:
-                            input("\n[Press ENTER to continue...]")
-                            line_count = 0
-                    
-                    print("-" * 60)
-                    print(f"Estimated tokens: {tokens}")
+                handler = self._exact_cmds.get(cmd_upper)
+                if handler:
+                    handler()
+                    continue
                 
+                for prefix, handler in self._prefix_cmds:
+                    if cmd_upper.startswith(prefix):
+                        handler(command[len(prefix):])
+                        break
                 else:
                     print(f"Unknown command: {command}")
                     print("Type HELP for available commands")
@@ -2,12 +2,16 @@
 import requests
 import xml.etree.ElementTree as ET
 
+# Shared keep-alive session, reused by repeated main() calls
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip", "User-Agent": "emcomm-bbs-hamqsl/1.0"})
+
 def main():
 
     # Get XML file from web server
     url = "https://www.hamqsl.com/solarxml.php?nwra=north&muf=grnlnd"
 
-    webxml = (requests.get(url)).content
+    webxml = _SESSION.get(url, timeout=(3, 5)).content
     #print(webxml)
 
     root = ET.fromstring(webxml)
@@ -6,10 +6,53 @@ For linbpq BBS integration - searches ISED amateur radio database
 
 import os
 import json
+import mmap
+import pickle
 import sys
+from array import array
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Length of the substrings indexed for partial-match search
+NGRAM_SIZE = 3
+
+# Bump when the layout of the .pkl index sidecar changes
+INDEX_CACHE_VERSION = 4
+
+# Record detail display order and field labels
+FIELD_LABELS = (
+    ('callsign', 'Callsign'),
+    ('first_name', 'First Name'),
+    ('surname', 'Surname'),
+    ('address_line', 'Address'),
+    ('city', 'City'),
+    ('prov_cd', 'Province'),
+    ('postal_code', 'Postal Code'),
+    ('qual_a', 'Qualification A'),
+    ('qual_b', 'Qualification B'),
+    ('qual_c', 'Qualification C'),
+    ('qual_d', 'Qualification D'),
+    ('qual_e', 'Qualification E'),
+    ('club_name', 'Club Name'),
+    ('club_name_2', 'Club Name 2'),
+    ('club_address', 'Club Address'),
+    ('club_city', 'Club City'),
+    ('club_prov_cd', 'Club Province'),
+    ('club_postal_code', 'Club Postal Code')
+)
+
+# Fields kept from the ISED records; search fields come first and are always present
+SEARCH_FIELDS = ('callsign', 'first_name', 'surname')
+RECORD_FIELDS = tuple(field for field, _ in FIELD_LABELS)
+
+# Separates fields within a search row
+FIELD_SEP = '\x1f'
+
 class CallsignLookup:
     """Console application for searching Canadian amateur radio callsigns"""
     
@@ -34,10 +77,15 @@ class CallsignLookup:
             '13': {'code': 'nv', 'name': 'Nunavut (VY0)'},
             '14': {'code': 'others', 'name': 'Others/Unclassified'}
         }
+        self._code_to_name = {p['code']: p['name'] for p in self.provinces.values()}
         
         self.current_data = []
         self.current_province = ""
         self.last_search_results = []
+        
+        # Search index for current_data (built by _build_search_index)
+        self._search_rows = []
+        self._ngram_index = {}
     
     def show_banner(self):
         """Display application banner"""
@@ -52,10 +100,15 @@ class CallsignLookup:
         print("Select Province/Territory to search:")
         print("-" * 40)
         
+        # One directory read instead of a stat per province file
+        try:
+            with os.scandir(self.json_path) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            present = set()
+        
         for key, province in self.provinces.items():
-            # Check if JSON file exists
-            json_file = os.path.join(self.json_path, f"{province['code']}.json")
-            status = "✓" if os.path.exists(json_file) else "✗"
+            status = "✓" if f"{province['code']}.json" in present else "✗"
             print(f"{key:2}. {status} {province['name']}")
         
         print()
@@ -83,10 +136,21 @@ class CallsignLookup:
                 print(f"Expected: {json_file}")
                 return False
             
-            with open(json_file, 'r', encoding='utf-8') as f:
-                self.current_data = json.load(f)
+            if not self._load_index_cache(json_file):
+                # Parse straight from the mapped file, no intermediate str
+                with open(json_file, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if orjson:
+                        with memoryview(mm) as view:
+                            self.current_data = orjson.loads(view)
+                    else:
+                        self.current_data = json.loads(mm[:])
+                
+                self._compact_records()
+                self._build_search_index()
+                self._save_index_cache(json_file)
             
-            province_name = next(p['name'] for p in self.provinces.values() if p['code'] == province_code)
+            province_name = self._code_to_name[province_code]
             self.current_province = province_name
             
             print(f"Loaded {len(self.current_data)} records for {province_name}")
@@ -99,27 +163,122 @@ class CallsignLookup:
             print(f"Error loading data: {e}")
             return False
     
+    def _compact_records(self):
+        """Keep only known, non-empty fields and share repeated values"""
+        intern = sys.intern
+        records = []
+        
+        for record in self.current_data:
+            compact = {field: record.get(field, '') for field in SEARCH_FIELDS}
+            for field in RECORD_FIELDS[len(SEARCH_FIELDS):]:
+                value = record.get(field)
+                if value:
+                    compact[field] = intern(value)
+            records.append(compact)
+        
+        self.current_data = records
+    
+    def _build_search_index(self):
+        """Build fused lowercase search rows and an n-gram index over current_data"""
+        rows = []
+        index = {}
+        
+        for i, record in enumerate(self.current_data):
+            fields = [record.get(field, '').lower() for field in SEARCH_FIELDS]
+            
+            # One string per record, so a match is a single substring test
+            row = FIELD_SEP.join(fields)
+            rows.append(row)
+            
+            grams = set()
+            for text in fields:
+                for j in range(len(text) - NGRAM_SIZE + 1):
+                    grams.add(text[j:j + NGRAM_SIZE])
+            
+            for gram in grams:
+                postings = index.get(gram)
+                if postings is None:
+                    postings = index[gram] = array('i')
+                postings.append(i)
+        
+        self._search_rows = rows
+        self._ngram_index = index
+    
+    def _index_cache_path(self, json_file: str) -> str:
+        """Path of the pickled search index sidecar for a province file"""
+        return os.path.splitext(json_file)[0] + '.pkl'
+    
+    def _load_index_cache(self, json_file: str) -> bool:
+        """Load records and search index from the sidecar if it is up to date"""
+        cache_file = self._index_cache_path(json_file)
+        
+        try:
+            if os.path.getmtime(cache_file) < os.path.getmtime(json_file):
+                return False
+            
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            
+            if cached[0] != INDEX_CACHE_VERSION:
+                return False
+            
+            _, self.current_data, self._search_rows, self._ngram_index = cached
+            return True
+        except Exception:
+            return False
+    
+    def _save_index_cache(self, json_file: str):
+        """Write records and search index to the sidecar (best effort)"""
+        cache_file = self._index_cache_path(json_file)
+        tmp_file = cache_file + '.tmp'
+        cached = (INDEX_CACHE_VERSION, self.current_data, self._search_rows,
+                  self._ngram_index)
+        
+        try:
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+    
+    def _search_candidates(self, query_lower: str):
+        """Record indices that may contain query_lower, in file order"""
+        postings = []
+        for gram in {query_lower[j:j + NGRAM_SIZE] for j in range(len(query_lower) - NGRAM_SIZE + 1)}:
+            posting = self._ngram_index.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        
+        # Intersect starting from the shortest posting list
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        
+        return sorted(candidates)
+    
     def search_records(self, query: str) -> List[Dict[str, Any]]:
         """Search records by callsign or name (partial matches)"""
         if not query:
             return []
         
         query_lower = query.lower().strip()
-        results = []
+        rows = self._search_rows
         
-        for record in self.current_data:
-            # Combine the 3 search fields as mentioned
-            callsign = record.get('callsign', '').lower()
-            first_name = record.get('first_name', '').lower()
-            surname = record.get('surname', '').lower()
-            
-            # Search in any of the three fields (partial match)
-            if (query_lower in callsign or 
-                query_lower in first_name or 
-                query_lower in surname):
-                results.append(record)
+        if len(query_lower) < NGRAM_SIZE:
+            # Too short for the n-gram index, test every row
+            candidates = range(len(self.current_data))
+        else:
+            candidates = self._search_candidates(query_lower)
         
-        return results
+        # One test per row covers all three search fields (partial match)
+        return [self.current_data[i] for i in candidates if query_lower in rows[i]]
     
     def display_search_results(self, results: List[Dict[str, Any]]):
         """Display search results with numbers"""
@@ -155,30 +314,8 @@ class CallsignLookup:
         print("RECORD DETAILS")
         print("=" * 50)
         
-        # Define display order and field labels
-        field_labels = {
-            'callsign': 'Callsign',
-            'first_name': 'First Name',
-            'surname': 'Surname', 
-            'address_line': 'Address',
-            'city': 'City',
-            'prov_cd': 'Province',
-            'postal_code': 'Postal Code',
-            'qual_a': 'Qualification A',
-            'qual_b': 'Qualification B', 
-            'qual_c': 'Qualification C',
-            'qual_d': 'Qualification D',
-            'qual_e': 'Qualification E',
-            'club_name': 'Club Name',
-            'club_name_2': 'Club Name 2',
-            'club_address': 'Club Address',
-            'club_city': 'Club City',
-            'club_prov_cd': 'Club Province',
-            'club_postal_code': 'Club Postal Code'
-        }
-        
         # Display only fields with data
-        for field, label in field_labels.items():
+        for field, label in FIELD_LABELS:
             value = record.get(field, '').strip()
             if value:  # Only show fields that have data
                 print(f"{label:20}: {value}")
@@ -202,10 +339,12 @@ class CallsignLookup:
                 if not user_input:
                     continue
                 
-                if user_input.lower() == 'quit':
+                command = user_input.lower()
+                
+                if command == 'quit':
                     return 'quit'
                 
-                if user_input.lower() == 'back':
+                if command == 'back':
                     return 'back'
                 
                 # Check if input is a number (for viewing details)
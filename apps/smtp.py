@@ -5,9 +5,6 @@ Designed to work with telnet console and later integrate with VARA/LinBPQ
 Similar to Winlink functionality for packet radio
 """
 
-import smtplib
-from email.mime.text import MIMEText
-from email.utils import formatdate
 import sys
 import os
 from datetime import datetime
@@ -20,12 +17,19 @@ class RFSMTPGateway:
         self.config_path = os.path.join(script_dir, config_file)
         self.config = self.load_config()
         
+        # Logged-in SMTP connection, kept open between messages
+        self._server = None
+        
+        # Built on first connect so the CA bundle is loaded once
+        self._ssl_context = None
+        
     def load_config(self):
         """Load configuration from JSON file"""
         default_config = {
             "smtp_server": "smtp.gmail.com",
             "smtp_port": 587,
             "use_tls": True,
+            "use_tls_mode": "starttls",
             "gateway_email": "",
             "gateway_password": "",
             "gateway_name": "RF Gateway"
@@ -48,25 +52,181 @@ class RFSMTPGateway:
             print(f"Error reading config file: {e}")
             return default_config
     
+    def _implicit_tls(self):
+        """True when TLS starts with the connection (SMTPS, usually port 465)"""
+        return self.config['use_tls'] and (
+            self.config.get('use_tls_mode') == 'implicit' or self.config['smtp_port'] == 465)
+    
+    def _connect(self):
+        """Open, secure and log in a new SMTP connection"""
+        # smtplib/ssl are imported on first use so the console starts fast
+        import smtplib
+        import ssl
+        
+        self.close()
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        if self._implicit_tls():
+            # No EHLO/STARTTLS/EHLO exchange before the handshake
+            server = smtplib.SMTP_SSL(self.config['smtp_server'], self.config['smtp_port'],
+                                      timeout=30, context=self._ssl_context)
+        else:
+            server = smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port'], timeout=30)
+        try:
+            if self.config['use_tls'] and not self._implicit_tls():
+                server.starttls(context=self._ssl_context)
+            server.login(self.config['gateway_email'], self.config['gateway_password'])
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+        return server
+    
+    def close(self):
+        """Close the cached SMTP connection, if any"""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except Exception:
+            self._server.close()
+        self._server = None
+    
+    def _reset(self, server):
+        """RSET after a refused command so the connection stays usable"""
+        import smtplib
+        
+        try:
+            server.rset()
+        except (smtplib.SMTPException, OSError):
+            pass
+    
+    def _send_envelope(self, server, to_email, size):
+        """Send MAIL FROM and RCPT TO for one message"""
+        import smtplib
+        
+        server.ehlo_or_helo_if_needed()
+        sender = self.config['gateway_email']
+        options = [f"SIZE={size}"] if server.does_esmtp and server.has_extn('size') else []
+        
+        code, resp = server.mail(sender, options)
+        if code != 250:
+            if code != 421:
+                self._reset(server)
+            raise smtplib.SMTPSenderRefused(code, resp, sender)
+        
+        code, resp = server.rcpt(to_email)
+        if code == 421:
+            raise smtplib.SMTPResponseException(code, resp)
+        if code not in (250, 251):
+            self._reset(server)
+            raise smtplib.SMTPRecipientsRefused({to_email: (code, resp)})
+    
+    def _sendmail(self, to_email, text):
+        """Send on the cached connection, reconnecting once if it was dropped
+        
+        Only the envelope is retried: once DATA has started the server may
+        already hold the message, and a resend could deliver it twice.
+        """
+        import smtplib
+        
+        for attempt in range(2):
+            server = self._server or self._connect()
+            try:
+                self._send_envelope(server, to_email, len(text))
+                break
+            except smtplib.SMTPResponseException as e:
+                # 421 is how a server drops a connection it considers idle
+                if e.smtp_code != 421:
+                    raise
+                self.close()
+                if attempt:
+                    raise
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self.close()
+                if attempt:
+                    raise
+        
+        try:
+            code, resp = server.data(text)
+        except smtplib.SMTPResponseException as e:
+            if e.smtp_code == 421:
+                self.close()
+            else:
+                self._reset(server)
+            raise
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            self.close()
+            raise
+        if code != 250:
+            if code == 421:
+                self.close()
+            else:
+                self._reset(server)
+            raise smtplib.SMTPDataError(code, resp)
+    
     def test_connection(self):
         """Test SMTP gateway connection"""
         if not self.config['gateway_email'] or not self.config['gateway_password']:
             print("ERROR: Gateway email and password must be configured")
             return False
-            
+        
+        import smtplib
+        
         try:
-            server = smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port'])
-            if self.config['use_tls']:
-                server.starttls()
-            server.login(self.config['gateway_email'], self.config['gateway_password'])
-            server.quit()
+            # Reuse a live connection rather than opening a throwaway one
+            try:
+                if self._server is None or self._server.noop()[0] != 250:
+                    self._connect()
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self._connect()
             print("SMTP Gateway connection test: SUCCESS")
             return True
             
         except Exception as e:
+            self.close()
             print(f"SMTP Gateway connection test: FAILED - {str(e)}")
             return False
     
+    def _format_message(self, sender_name, reply_to_email, to_email, subject, body):
+        """Build an RFC 5322 plain-text message as bytes, ready for sendmail"""
+        import binascii
+        from email.header import Header
+        from email.utils import formataddr, formatdate
+        
+        sender = formataddr((sender_name, reply_to_email))
+        if not subject.isascii():
+            subject = Header(subject, 'utf-8').encode()
+        
+        # Required headers once each per RFC 5322, plus safe X- headers
+        headers = [
+            f"From: {formataddr((self.config['gateway_name'], self.config['gateway_email']))}",
+            f"To: {to_email}",
+            f"Subject: {subject}",
+            f"Date: {formatdate(localtime=True)}",
+            f"Reply-To: {sender}",
+            "X-RF-Gateway: LinBPQ-VARA",
+            f"X-Emergency-Origin: {sender}",
+            "MIME-Version: 1.0",
+            "Content-Type: text/plain; charset=utf-8",
+        ]
+        
+        # Only \n ends a line; splitlines() would also break on form feeds,
+        # U+2028 and the like inside the user's text
+        data = "\n".join(line.rstrip("\r") for line in body.split("\n")).encode('utf-8')
+        
+        # Plain short-lined ASCII goes as is; anything else is quoted-printable,
+        # so no relay ever sees 8-bit data or a line over 998 octets
+        if data.isascii() and all(len(line) <= 998 for line in data.split(b"\n")):
+            headers.append("Content-Transfer-Encoding: 7bit")
+        else:
+            headers.append("Content-Transfer-Encoding: quoted-printable")
+            data = binascii.b2a_qp(data, istext=True)
+        
+        # smtplib only normalizes line endings for str messages
+        head = "\r\n".join(headers) + "\r\n\r\n"
+        return head.encode('utf-8') + data.replace(b"\n", b"\r\n") + b"\r\n"
+    
     def send_message(self):
         """Send email via SMTP gateway"""
         print("\n=== RF SMTP Gateway - Compose Message ===")
@@ -80,12 +240,16 @@ class RFSMTPGateway:
         subject = input("Subject: ").strip()
         
         print("\nMessage body (type 'END' on a new line to finish):")
+        sys.stdout.flush()
         body_lines = []
+        # Read the body straight off stdin - input() adds prompt handling
+        # per line, which adds up on long pasted messages
+        readline = sys.stdin.readline
         while True:
-            line = input()
-            if line.strip().upper() == 'END':
+            line = readline()
+            if not line or line.strip().upper() == 'END':
                 break
-            body_lines.append(line)
+            body_lines.append(line.rstrip('\r\n'))
         
         message_body = '\n'.join(body_lines)
         
@@ -102,25 +266,6 @@ class RFSMTPGateway:
             return False
         
         try:
-            # Create message with strict RFC compliance
-            msg = MIMEText(message_body, 'plain')
-            
-            # Set required headers (only once each per RFC 5322)
-            msg['From'] = f"{self.config['gateway_name']} <{self.config['gateway_email']}>"
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            # RFC 2822 compliant Date header
-            from email.utils import formatdate
-            msg['Date'] = formatdate(localtime=True)
-            
-            # Reply-To for responses
-            msg['Reply-To'] = f"{sender_name} <{reply_to_email}>"
-            
-            # Optional custom headers (X- headers are safe)
-            msg['X-RF-Gateway'] = 'LinBPQ-VARA'
-            msg['X-Emergency-Origin'] = f"{sender_name} <{reply_to_email}>"
-            
             # Create body with sender info
             full_body = f"Message sent via RF SMTP Gateway\n"
             full_body += f"From: {sender_name} <{reply_to_email}>\n"
@@ -131,18 +276,9 @@ class RFSMTPGateway:
             full_body += f"This message was relayed via RF SMTP Gateway\n"
             full_body += f"Reply to: {reply_to_email}"
             
-            # Update the message body
-            msg.set_payload(full_body)
-            
             # Send via SMTP
-            server = smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port'])
-            if self.config['use_tls']:
-                server.starttls()
-            server.login(self.config['gateway_email'], self.config['gateway_password'])
-            
-            text = msg.as_string()
-            server.sendmail(self.config['gateway_email'], to_email, text)
-            server.quit()
+            text = self._format_message(sender_name, reply_to_email, to_email, subject, full_body)
+            self._sendmail(to_email, text)
             
             print(f"\nSUCCESS: Message sent to {to_email}")
             print(f"Replies will go to: {reply_to_email}")
@@ -156,7 +292,8 @@ class RFSMTPGateway:
         """Show gateway status"""
         print("\n=== RF SMTP Gateway Status ===")
         print(f"SMTP Server: {self.config['smtp_server']}:{self.config['smtp_port']}")
-        print(f"TLS Enabled: {self.config['use_tls']}")
+        print(f"TLS Enabled: {self.config['use_tls']}"
+              f"{' (implicit)' if self._implicit_tls() else ''}")
         print(f"Gateway Email: {self.config['gateway_email']}")
         print(f"Gateway Name: {self.config['gateway_name']}")
         
@@ -211,6 +348,8 @@ class RFSMTPGateway:
                 break
             except Exception as e:
                 print(f"Error: {str(e)}")
+        
+        self.close()
 
 def main():
     """Main entry point"""
@@ -220,6 +359,7 @@ def main():
             "smtp_server": "smtp.gmail.com",
             "smtp_port": 587,
             "use_tls": True,
+            "use_tls_mode": "starttls",
             "gateway_email": "your-gateway@gmail.com",
             "gateway_password": "your-app-password",
             "gateway_name": "RF Emergency Gateway"
@@ -11,7 +11,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from wiki.config import load_config, validate_zim_files, display_zim_menu, create_example_config
-from wiki.zim_reader import WikiZimReader
+from wiki import get_reader
 from wiki.console_interface import WikiConsoleInterface
 
 def main():
@@ -103,15 +103,17 @@ def main():
     print("=" * 50)
     
     try:
-        # Initialize ZIM reader
-        zim_reader = WikiZimReader(zim_file_path)
+        # Initialize ZIM reader (shared if this file is already open)
+        zim_reader = get_reader(zim_file_path)
         
         # Get configuration settings
         default_max_chars = config.get('default_max_chars', 2000)
         rf_callsign = config.get('rf_callsign', 'VA2OPS')
+        parallel_probe = config.get('parallel_probe', False)
+        zim_reader.parallel_probe = parallel_probe
         
         # Start console interface with configuration
-        console = WikiConsoleInterface(zim_reader, default_max_chars, rf_callsign, selected_zim)
+        console = WikiConsoleInterface(zim_reader, default_max_chars, rf_callsign, selected_zim, parallel_probe)
         console.start_interactive_session()
         
     except FileNotFoundError as e:
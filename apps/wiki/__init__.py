@@ -3,16 +3,34 @@ Wikipedia ZIM Reader Package
 A modular interface for reading Wikipedia ZIM files offline
 """
 
-from .zim_reader import WikiZimReader
+import os
+from typing import Dict
+
+from .zim_reader import WikiZimReader, ArticleHit
 from .console_interface import WikiConsoleInterface
 from .config import load_config, validate_zim_files, display_zim_menu, create_example_config
 
 __version__ = "1.1.0"
 __author__ = "VA2GWM"
 
+# Open readers, keyed by real path, so each ZIM archive is loaded once per
+# process and inherited by any children forked after it was opened
+_READERS: Dict[str, WikiZimReader] = {}
+
+def get_reader(zim_file_path: str) -> WikiZimReader:
+    """Return a shared WikiZimReader for a ZIM file, opening it on first use"""
+    key = os.path.realpath(zim_file_path)
+    reader = _READERS.get(key)
+    if reader is None:
+        reader = WikiZimReader(zim_file_path)
+        _READERS[key] = reader
+    return reader
+
 __all__ = [
     'WikiZimReader',
+    'ArticleHit',
     'WikiConsoleInterface', 
+    'get_reader',
     'load_config',
     'validate_zim_files',
     'display_zim_menu',
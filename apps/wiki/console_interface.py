@@ -2,19 +2,143 @@
 Console interface for Wikipedia ZIM access
 """
 
+import hashlib
+import json
+import os
+import sqlite3
+import sys
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
+from .zim_reader import ArticleHit
+
+# Namespace prefixes tried when guessing where an article is stored
+_LETTER_PREFIXES = tuple(f"{c}/" for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_PATH_PREFIXES = _LETTER_PREFIXES + ('',)
+_COMMON_PREFIXES = ('A/', 'P/', 'D/', 'M/', 'T/', 'L/', '')
+
+# Persistent cache of find results, shared by all sessions on this host
+FIND_CACHE_FILE = os.path.expanduser("~/.wikibbs_find_cache.db")
+FIND_CACHE_VERSION = 2  # bump when the stored match format changes
+
+# Worker threads used for find's path probes when parallel_probe is on
+PROBE_WORKERS = 8
+
+# (old, new) substitutions tried when a stored path does not resolve
+_PATH_REPLACEMENTS = (('_', ' '), (' ', '_'), (':', '_'), (':', ''), ("'", '_'), ("'", ''))
+
+# Well-known articles probed by the 'test' command
+_TEST_PATHS = ('A/Apple', 'A/Animal', 'F/France', 'P/Python', 'H/Hockey', 'M/Music')
+
+def _fast_wrap(text: str, wrapper: textwrap.TextWrapper) -> str:
+    """Greedy word wrap, equivalent to wrapper.fill() for plain text
+    
+    ASCII text without hyphens whose words are separated by single spaces
+    only - nearly all article prose - is wrapped with a simple word loop
+    instead of textwrap's regex-based chunking. Anything else, including
+    leading/trailing or any other whitespace, is handed to the wrapper.
+    """
+    if not text.isascii() or '-' in text:
+        return wrapper.fill(text)
+    words = text.split()
+    if ' '.join(words) != text:
+        return wrapper.fill(text)
+    width = wrapper.width
+    lines = []
+    line = []
+    line_len = 0
+    for word in words:
+        word_len = len(word)
+        if word_len > width:
+            return wrapper.fill(text)
+        if line and line_len + 1 + word_len > width:
+            lines.append(' '.join(line))
+            line = [word]
+            line_len = word_len
+        else:
+            line_len += word_len + 1 if line else word_len
+            line.append(word)
+    if line:
+        lines.append(' '.join(line))
+    return '\n'.join(lines)
+
+# Static help screen, printed as-is by the help command
+_HELP_TEXT = """
+Available Commands:
+  search <query>     - Search for articles (uses multiple search methods)
+  browse             - Browse available articles
+  read <number>      - Read full article by number from last results
+  read <number> <length> - Read article with custom length (e.g. read 1 5000)
+  read <number> all  - Read entire article with size confirmation
+  debug <number>     - Debug a specific search result to see what's wrong
+  find <n>        - Find how an article is actually stored
+  suggest <partial>  - Get article title suggestions
+  info               - Show information about the ZIM file
+  test               - Test libzim functionality and compatibility
+  help               - Show this help message
+  quit               - Exit the program
+
+Examples:
+  suggest hockey     # Find articles with "hockey" in title
+  search hockey      # Search for hockey-related articles
+  browse             # See what articles are available
+  read 1             # Read first result from last search/browse
+  find pink floyd    # See how Pink Floyd articles are stored
+
+Troubleshooting:
+  If "read" fails with "Article not found":
+  1. Use "debug <number>" to see what's wrong with a search result
+  2. Use "find <article_name>" to see the actual stored path
+  3. Try other articles from the search results
+  4. Use "browse" to find articles that definitely exist
+
+Features:
+- Multiple search methods (fulltext, suggestions, path guessing)
+- Robust error handling for different libzim versions
+- Content formatting optimized for console/RF display
+- Automatic fallback when search indices are unavailable
+
+This version includes improved error handling and compatibility fixes.
+
+"""
+
 class WikiConsoleInterface:
     """Console interface for Wikipedia ZIM access"""
     
-    def __init__(self, zim_reader, default_max_chars=2000, rf_callsign="VA2GWM", zim_info=None):
+    def __init__(self, zim_reader, default_max_chars=2000, rf_callsign="VA2GWM", zim_info=None, parallel_probe=False):
         self.zim_reader = zim_reader
         self.current_article = None
         self.last_search_results = []
         self.default_max_chars = default_max_chars
         self.rf_callsign = rf_callsign
         self.zim_info = zim_info or {"name": "Unknown ZIM File", "description": "No description"}
+        # Run find's direct-path probes on a thread pool (off by default -
+        # only pays off if the libzim build releases the GIL on lookups)
+        self._parallel_probe = parallel_probe
+        self._find_db = None  # opened on first find; False if unavailable
+        # Share the reader's cached path probes - 'find' and 'debug' repeat
+        # many of the paths that search and read have already checked
+        self._has_path = zim_reader._has_path
+        # Reused for every paragraph/snippet instead of textwrap.fill()
+        # building a fresh TextWrapper each call
+        self._wrapper = textwrap.TextWrapper(width=72)
+        self._snippet_wrapper = textwrap.TextWrapper(width=70, initial_indent="     ", subsequent_indent="     ")
+        
+        self._info_header = None
+        
+        # Command word -> handler; each handler gets the rest of the line
+        self._dispatch = {
+            'help': self._cmd_help,
+            'info': self._cmd_info,
+            'test': self._cmd_test,
+            'browse': self._cmd_browse,
+            'search': self._cmd_search,
+            'read': self._cmd_read,
+            'suggest': self._cmd_suggest,
+            'find': self._cmd_find,
+            'debug': self._cmd_debug,
+        }
     
     def start_interactive_session(self):
         """Start interactive console session"""
@@ -36,86 +160,8 @@ class WikiConsoleInterface:
         
         while True:
             try:
-                command = input("wiki> ").strip()
-                
-                if not command:
-                    continue
-                
-                if command.lower() in ['quit', 'exit', 'q']:
-                    print("73! Goodbye!")
+                if not self.handle_command(input("wiki> ")):
                     break
-                
-                elif command.lower() == 'help':
-                    self._show_help()
-                
-                elif command.lower() == 'info':
-                    self._show_info()
-                
-                elif command.lower() == 'test':
-                    self._test_api()
-                
-                elif command.lower() == 'browse':
-                    self.last_search_results = self._handle_browse()
-                
-                elif command.lower().startswith('search '):
-                    query = command[7:].strip()
-                    if query:
-                        self.last_search_results = self._handle_search(query)
-                    else:
-                        print("Usage: search <query>")
-                
-                elif command.lower().startswith('read '):
-                    try:
-                        parts = command[5:].strip().split()
-                        article_num = int(parts[0]) - 1
-                        
-                        # Check for 'all' keyword
-                        if len(parts) > 1 and parts[1].lower() == 'all':
-                            self._handle_read_all_confirmation(self.last_search_results, article_num)
-                        else:
-                            # Optional length parameter
-                            max_chars = self.default_max_chars  # use configured default
-                            if len(parts) > 1:
-                                max_chars = int(parts[1])
-                            self._handle_read(self.last_search_results, article_num, max_chars)
-                    except (ValueError, IndexError):
-                        print("Usage: read <number> [max_chars|all]")
-                        print("Example: read 1 3000  (read article 1 with max 3000 characters)")
-                        print("Example: read 1 all   (read entire article with confirmation)")
-                
-                elif command.lower().startswith('suggest '):
-                    partial = command[8:].strip()
-                    if partial:
-                        self._handle_suggestions(partial)
-                    else:
-                        print("Usage: suggest <partial_title>")
-                
-                elif command.lower().startswith('find '):
-                    # New command to help diagnose missing articles
-                    query = command[5:].strip()
-                    if query:
-                        self._handle_find(query)
-                    else:
-                        print("Usage: find <article_name>")
-                
-                elif command.lower().startswith('debug '):
-                    # New command to debug search results
-                    try:
-                        article_num = int(command[6:].strip()) - 1
-                        self._handle_debug_search_result(self.last_search_results, article_num)
-                    except (ValueError, IndexError):
-                        print("Usage: debug <number> (from last search results)")
-                
-                elif command.isdigit():
-                    # Shortcut: allow just typing a number instead of "read <number>"
-                    try:
-                        article_num = int(command) - 1
-                        self._handle_read(self.last_search_results, article_num, self.default_max_chars)
-                    except (ValueError, IndexError):
-                        print(f"Invalid article number. Choose 1-{len(self.last_search_results) if self.last_search_results else 0}")
-                
-                else:
-                    print(f"Unknown command: {command}. Type 'help' for available commands.")
             
             except KeyboardInterrupt:
                 print("\n73! Goodbye!")
@@ -126,7 +172,106 @@ class WikiConsoleInterface:
             except Exception as e:
                 print(f"Error: {e}")
     
-    def _handle_browse(self) -> List[Dict]:
+    def handle_command(self, command: str) -> bool:
+        """Run a single console command, returns False when the session should end
+        
+        Lets non-interactive callers (scripts, BBS front-ends) drive the
+        console a line at a time without going through input().
+        """
+        command = command.strip()
+        if not command:
+            return True
+        
+        # Shortcut: allow just typing a number instead of "read <number>"
+        try:
+            article_num = int(command) - 1
+        except ValueError:
+            pass
+        else:
+            self._handle_read(self.last_search_results, article_num, self.default_max_chars)
+            return True
+        
+        cmd, _, rest = command.partition(' ')
+        cmd = cmd.lower()
+        
+        if cmd in ('quit', 'exit', 'q'):
+            print("73! Goodbye!")
+            return False
+        
+        handler = self._dispatch.get(cmd)
+        if handler:
+            handler(rest.strip())
+        else:
+            print(f"Unknown command: {command}. Type 'help' for available commands.")
+        
+        return True
+    
+    def _cmd_help(self, args: str):
+        """help command"""
+        self._show_help()
+    
+    def _cmd_info(self, args: str):
+        """info command"""
+        self._show_info()
+    
+    def _cmd_test(self, args: str):
+        """test command"""
+        self._test_api()
+    
+    def _cmd_browse(self, args: str):
+        """browse command"""
+        self.last_search_results = self._handle_browse()
+    
+    def _cmd_search(self, query: str):
+        """search <query> command"""
+        if query:
+            self.last_search_results = self._handle_search(query)
+        else:
+            print("Usage: search <query>")
+    
+    def _cmd_read(self, args: str):
+        """read <number> [max_chars|all] command"""
+        try:
+            parts = args.split()
+            article_num = int(parts[0]) - 1
+            
+            # Check for 'all' keyword
+            if len(parts) > 1 and parts[1].lower() == 'all':
+                self._handle_read_all_confirmation(self.last_search_results, article_num)
+            else:
+                # Optional length parameter
+                max_chars = self.default_max_chars  # use configured default
+                if len(parts) > 1:
+                    max_chars = int(parts[1])
+                self._handle_read(self.last_search_results, article_num, max_chars)
+        except (ValueError, IndexError):
+            print("Usage: read <number> [max_chars|all]")
+            print("Example: read 1 3000  (read article 1 with max 3000 characters)")
+            print("Example: read 1 all   (read entire article with confirmation)")
+    
+    def _cmd_suggest(self, partial: str):
+        """suggest <partial> command"""
+        if partial:
+            self._handle_suggestions(partial)
+        else:
+            print("Usage: suggest <partial_title>")
+    
+    def _cmd_find(self, query: str):
+        """find <article_name> command - helps diagnose missing articles"""
+        if query:
+            self._handle_find(query)
+        else:
+            print("Usage: find <article_name>")
+    
+    def _cmd_debug(self, args: str):
+        """debug <number> command - debug a search result"""
+        try:
+            article_num = int(args) - 1
+            self._handle_debug_search_result(self.last_search_results, article_num)
+        except (ValueError, IndexError):
+            print("Usage: debug <number> (from last search results)")
+    
+    def _handle_browse(self) -> List[ArticleHit]:
         """Handle browse command"""
         print("Browsing available articles...")
         results = self.zim_reader.browse_articles(max_results=20)
@@ -135,20 +280,21 @@ class WikiConsoleInterface:
             print("No articles found to browse.")
             return []
         
-        print(f"\nFirst {len(results)} articles:")
-        print("-" * 50)
+        # Build the listing and write it in one go
+        out = [f"\nFirst {len(results)} articles:", "-" * 50]
         
         for i, result in enumerate(results, 1):
-            print(f"{i:2d}. {result['title']}")
-            if result.get('snippet'):
-                snippet = result['snippet'][:80] + "..." if len(result['snippet']) > 80 else result['snippet']
-                print(f"     {snippet}")
-            print()
-        
-        print("Use 'read <number>' to view an article")
+            out.append(f"{i:2d}. {result.title}")
+            if result.snippet:
+                snippet = result.snippet[:80] + "..." if len(result.snippet) > 80 else result.snippet
+                out.append(f"     {snippet}")
+            out.append("")
+        
+        out.append("Use 'read <number>' to view an article")
+        sys.stdout.write('\n'.join(out) + '\n')
         return results
     
-    def _handle_search(self, query: str) -> List[Dict]:
+    def _handle_search(self, query: str) -> List[ArticleHit]:
         """Handle search command"""
         print(f"Searching for: {query}")
         results = self.zim_reader.search_articles(query, max_results=10)
@@ -161,22 +307,22 @@ class WikiConsoleInterface:
             print("3. 'browse' to see available articles")
             return []
         
-        print(f"\nFound {len(results)} results:")
-        print("-" * 50)
+        # Build the listing and write it in one go
+        out = [f"\nFound {len(results)} results:", "-" * 50]
         
         for i, result in enumerate(results, 1):
-            print(f"{i:2d}. {result['title']}")
-            if result.get('snippet'):
+            out.append(f"{i:2d}. {result.title}")
+            if result.snippet:
                 # Wrap snippet text for console display
-                snippet = result['snippet'][:120] + "..." if len(result['snippet']) > 120 else result['snippet']
-                wrapped = textwrap.fill(snippet, width=70, initial_indent="     ", subsequent_indent="     ")
-                print(wrapped)
-            print()
+                snippet = result.snippet[:120] + "..." if len(result.snippet) > 120 else result.snippet
+                out.append(self._snippet_wrapper.fill(snippet))
+            out.append("")
         
-        print("Use 'read <number>' to view an article")
+        out.append("Use 'read <number>' to view an article")
+        sys.stdout.write('\n'.join(out) + '\n')
         return results
     
-    def _handle_read(self, search_results: List[Dict], article_index: int, max_chars: int = None):
+    def _handle_read(self, search_results: List[ArticleHit], article_index: int, max_chars: int = None):
         """Handle read command"""
         if max_chars is None:
             max_chars = self.default_max_chars
@@ -190,19 +336,19 @@ class WikiConsoleInterface:
             return
         
         article = search_results[article_index]
-        print(f"\n=== {article['title']} ===")
-        print("=" * (len(str(article['title'])) + 8))
+        # Collect the whole article display and write it in one go
+        out = [f"\n=== {article.title} ===", "=" * (len(str(article.title)) + 8)]
         
         # Get content with appropriate length for console display
-        content = self.zim_reader.get_article_content(article['path'], max_chars=max_chars)
+        content = self.zim_reader.get_article_content(article.path, max_chars=max_chars)
         if content:
             # Check if it's an error message
             if content.startswith("Error") or content.startswith("Article not found"):
-                print(content)
-                print("\nTroubleshooting suggestions:")
-                print("1. Try a different article from the search results")
-                print("2. Use 'test' command to check ZIM file compatibility")
-                print("3. Try 'browse' to find articles that definitely exist")
+                out.append(content)
+                out.append("\nTroubleshooting suggestions:")
+                out.append("1. Try a different article from the search results")
+                out.append("2. Use 'test' command to check ZIM file compatibility")
+                out.append("3. Try 'browse' to find articles that definitely exist")
             else:
                 # Format for console display - preserve the spacing we added
                 # Split by double newlines to preserve sentence spacing
@@ -211,28 +357,26 @@ class WikiConsoleInterface:
                 
                 for paragraph in paragraphs:
                     paragraph = paragraph.strip()
-                    if paragraph:
-                        # Only wrap individual paragraphs, not the whole content
-                        if paragraph.startswith('===') and paragraph.endswith('==='):
-                            # Don't wrap headers
-                            formatted_paragraphs.append(paragraph)
-                        elif paragraph.startswith('•'):
-                            # Don't wrap list items
-                            formatted_paragraphs.append(paragraph)
-                        else:
-                            # Wrap long sentences but preserve spacing
-                            wrapped = textwrap.fill(paragraph, width=72)
-                            formatted_paragraphs.append(wrapped)
+                    if not paragraph:
+                        continue
+                    # Only wrap individual paragraphs, not the whole content;
+                    # headers and list items are left as they are
+                    if paragraph.startswith(('===', '•')):
+                        formatted_paragraphs.append(paragraph)
+                    else:
+                        # Wrap long sentences but preserve spacing
+                        formatted_paragraphs.append(_fast_wrap(paragraph, self._wrapper))
                 
                 # Join back with double newlines to preserve our spacing
-                print('\n\n'.join(formatted_paragraphs))
+                out.append('\n\n'.join(formatted_paragraphs))
         else:
-            print("Unable to retrieve article content.")
+            out.append("Unable to retrieve article content.")
         
-        print("\n" + "=" * 50)
+        out.append("\n" + "=" * 50)
+        sys.stdout.write('\n'.join(out) + '\n')
         self.current_article = article
     
-    def _handle_read_all_confirmation(self, search_results: List[Dict], article_index: int):
+    def _handle_read_all_confirmation(self, search_results: List[ArticleHit], article_index: int):
         """Handle read all command with confirmation"""
         if not search_results:
             print("No search results available. Search or browse first.")
@@ -245,11 +389,11 @@ class WikiConsoleInterface:
         article = search_results[article_index]
         
         # Get the full article content to check size
-        print(f"Checking article size: {article['title']}...")
+        print(f"Checking article size: {article.title}...")
         
         try:
             # Get the full content without truncation to measure size
-            full_content = self.zim_reader.get_article_content(article['path'], max_chars=None)
+            full_content = self.zim_reader.get_article_content(article.path, max_chars=None)
             
             if not full_content or full_content.startswith("Error") or full_content.startswith("Article not found"):
                 print("Error: Unable to retrieve article for size check.")
@@ -266,7 +410,7 @@ class WikiConsoleInterface:
             
             # Show size information
             print(f"\n=== Article Size Information ===")
-            print(f"Title: {article['title']}")
+            print(f"Title: {article.title}")
             print(f"Content length: {content_length:,} characters")
             print(f"Number of lines: {content_lines:,}")
             print(f"Approximate words: {words_approx:,}")
@@ -315,10 +459,10 @@ class WikiConsoleInterface:
         except Exception as e:
             print(f"Error checking article size: {e}")
     
-    def _display_full_article(self, article: Dict, content: str):
+    def _display_full_article(self, article: ArticleHit, content: str):
         """Display the full article content"""
-        print(f"=== {article['title']} ===")
-        print("=" * (len(str(article['title'])) + 8))
+        print(f"=== {article.title} ===")
+        print("=" * (len(str(article.title)) + 8))
         
         # Split by double newlines to preserve sentence spacing
         paragraphs = content.split('\n\n')
@@ -326,18 +470,15 @@ class WikiConsoleInterface:
         
         for paragraph in paragraphs:
             paragraph = paragraph.strip()
-            if paragraph:
-                # Only wrap individual paragraphs, not the whole content
-                if paragraph.startswith('===') and paragraph.endswith('==='):
-                    # Don't wrap headers
-                    formatted_paragraphs.append(paragraph)
-                elif paragraph.startswith('•'):
-                    # Don't wrap list items
-                    formatted_paragraphs.append(paragraph)
-                else:
-                    # Wrap long sentences but preserve spacing
-                    wrapped = textwrap.fill(paragraph, width=72)
-                    formatted_paragraphs.append(wrapped)
+            if not paragraph:
+                continue
+            # Only wrap individual paragraphs, not the whole content;
+            # headers and list items are left as they are
+            if paragraph.startswith(('===', '•')):
+                formatted_paragraphs.append(paragraph)
+            else:
+                # Wrap long sentences but preserve spacing
+                formatted_paragraphs.append(_fast_wrap(paragraph, self._wrapper))
         
         # Join back with double newlines to preserve our spacing
         print('\n\n'.join(formatted_paragraphs))
@@ -351,13 +492,54 @@ class WikiConsoleInterface:
         """Find and display information about how articles are stored"""
         print(f"Searching for articles matching: '{query}'")
         
+        # Where an article is stored doesn't change for a given ZIM file,
+        # so reuse the answer from any earlier session
+        matches = self._find_cache_get(query)
+        if matches is not None:
+            print("Using cached find results...")
+        else:
+            matches = self._find_matches(query)
+            self._find_cache_put(query, matches)
+        
+        if matches:
+            print(f"\nFound {len(matches)} unique matches:")
+            print("-" * 60)
+            
+            for i, match in enumerate(matches.values(), 1):
+                print(f"{i:2d}. Title: '{match.title}'")
+                print(f"     Path:  '{match.path}'")
+                print(f"     Method: {match.method}")
+                
+                # Test accessibility
+                try:
+                    content = self.zim_reader.get_article_content(match.path, 100)
+                    if content and not content.startswith("Error") and not content.startswith("Article not found"):
+                        print(f"     Status: ✓ Readable")
+                    else:
+                        print(f"     Status: ✗ Not readable")
+                except:
+                    print(f"     Status: ? Unknown")
+                print()
+        else:
+            print("No matches found.")
+            print("The article might be:")
+            print("1. Stored under a completely different name")
+            print("2. Not present in this ZIM file")
+            print("3. Using a naming convention not covered by the search")
+            print("\nTry: 'debug <number>' on a search result to see what's actually returned")
+
+    def _find_matches(self, query: str) -> Dict[str, ArticleHit]:
+        """Probe the archive for the ways an article may be stored, keyed by path"""
         # Since archive iteration doesn't work, try alternative approaches
-        matches = []
-        query_lower = query.lower()
+        matches = {}  # path -> match, first method to find a path wins
+        title_cache = {}  # path -> entry title, so each entry is looked up once
+        query_folded = query.casefold()
+        words = query.split()
         
         # Method 1: Try direct path construction and testing
         print("Trying direct path construction...")
-        query_variants = [
+        # dict.fromkeys drops variants that came out identical to an earlier one
+        query_variants = dict.fromkeys([
             query,
             query.replace(' ', '_'),
             query.replace('_', ' '),
@@ -367,23 +549,31 @@ class WikiConsoleInterface:
             query.replace(':', ''),
             query.replace("'", '_'),
             query.replace("'", ''),
-        ]
-        
-        path_prefixes = ['A/', 'B/', 'C/', 'D/', 'E/', 'F/', 'G/', 'H/', 'I/', 'J/', 'K/', 'L/', 'M/', 'N/', 'O/', 'P/', 'Q/', 'R/', 'S/', 'T/', 'U/', 'V/', 'W/', 'X/', 'Y/', 'Z/', '']
-        
+        ])
+        
+        # Optionally probe every candidate up front on a thread pool
+        probe = self._has_path
+        if self._parallel_probe:
+            candidates = [prefix + variant for variant in query_variants for prefix in _PATH_PREFIXES]
+            with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+                hits = {path for path, exists in zip(candidates, executor.map(self._safe_has_path, candidates)) if exists}
+            probe = hits.__contains__
+        
+        # An article lives under one namespace, so stop at the first hit
+        # for each variant (A/ is tried first, the bare path last)
         for variant in query_variants:
-            for prefix in path_prefixes:
-                test_path = f"{prefix}{variant}" if prefix else variant
+            for prefix in _PATH_PREFIXES:
+                test_path = prefix + variant
                 try:
-                    if self.zim_reader.archive.has_entry_by_path(test_path):
-                        entry = self.zim_reader.archive.get_entry_by_path(test_path)
-                        title = self.zim_reader._safe_get_attribute(entry, 'title', test_path)
-                        matches.append({
-                            'title': title,
-                            'path': test_path,
-                            'method': 'direct_path'
-                        })
+                    if probe(test_path):
+                        title = title_cache.get(test_path)
+                        if title is None:
+                            entry = self.zim_reader.archive.get_entry_by_path(test_path)
+                            title = self.zim_reader._safe_get_attribute(entry, 'title', test_path)
+                            title_cache[test_path] = title
+                        matches.setdefault(test_path, ArticleHit(title, test_path, method='direct_path'))
                         print(f"✓ Found: '{test_path}' -> '{title}'")
+                        break
                 except:
                     continue
         
@@ -391,19 +581,16 @@ class WikiConsoleInterface:
         if self.zim_reader.suggestion_searcher:
             print("Trying suggestion-based search...")
             try:
-                suggestions = self.zim_reader.get_suggestions(query.split()[0] if query.split() else query, 20)
+                suggestions = self.zim_reader.get_suggestions(words[0] if words else query, 20)
                 for suggestion in suggestions:
-                    if query_lower in suggestion.lower():
+                    if query_folded in suggestion.casefold():
                         # Try to find the actual path for this suggestion
-                        for prefix in ['A/', 'B/', 'C/', 'D/', 'E/', 'F/', 'G/', 'H/', 'I/', 'J/', 'K/', 'L/', 'M/', 'N/', 'O/', 'P/', 'Q/', 'R/', 'S/', 'T/', 'U/', 'V/', 'W/', 'X/', 'Y/', 'Z/']:
-                            test_path = f"{prefix}{suggestion.replace(' ', '_')}"
+                        suggestion_path = suggestion.replace(' ', '_')
+                        for prefix in _LETTER_PREFIXES:
+                            test_path = prefix + suggestion_path
                             try:
-                                if self.zim_reader.archive.has_entry_by_path(test_path):
-                                    matches.append({
-                                        'title': suggestion,
-                                        'path': test_path,
-                                        'method': 'suggestion'
-                                    })
+                                if self._has_path(test_path):
+                                    matches.setdefault(test_path, ArticleHit(suggestion, test_path, method='suggestion'))
                                     print(f"✓ Found via suggestions: '{test_path}' -> '{suggestion}'")
                                     break
                             except:
@@ -413,7 +600,6 @@ class WikiConsoleInterface:
         
         # Method 3: Try a limited brute force with common patterns
         print("Trying common naming patterns...")
-        words = query.split()
         if len(words) > 1:
             # Try different combinations
             patterns = [
@@ -425,58 +611,80 @@ class WikiConsoleInterface:
                 ' '.join(word.title() for word in words),
             ]
             
-            for pattern in patterns:
-                for prefix in ['A/', 'P/', 'D/', 'M/', 'T/', 'L/', '']:  # Most common prefixes
-                    test_path = f"{prefix}{pattern}" if prefix else pattern
-                    try:
-                        if self.zim_reader.archive.has_entry_by_path(test_path):
-                            entry = self.zim_reader.archive.get_entry_by_path(test_path)
-                            title = self.zim_reader._safe_get_attribute(entry, 'title', test_path)
-                            matches.append({
-                                'title': title,
-                                'path': test_path,
-                                'method': 'pattern_match'
-                            })
-                            print(f"✓ Found via pattern: '{test_path}' -> '{title}'")
-                    except:
-                        continue
-        
-        # Remove duplicates
-        unique_matches = []
-        seen_paths = set()
-        for match in matches:
-            if match['path'] not in seen_paths:
-                unique_matches.append(match)
-                seen_paths.add(match['path'])
-        
-        if unique_matches:
-            print(f"\nFound {len(unique_matches)} unique matches:")
-            print("-" * 60)
+            candidates = [prefix + pattern for pattern in patterns for prefix in _COMMON_PREFIXES]
             
-            for i, match in enumerate(unique_matches, 1):
-                print(f"{i:2d}. Title: '{match['title']}'")
-                print(f"     Path:  '{match['path']}'")
-                print(f"     Method: {match['method']}")
-                
-                # Test accessibility
+            for test_path in candidates:
                 try:
-                    content = self.zim_reader.get_article_content(match['path'], 100)
-                    if content and not content.startswith("Error") and not content.startswith("Article not found"):
-                        print(f"     Status: ✓ Readable")
-                    else:
-                        print(f"     Status: ✗ Not readable")
+                    if self._has_path(test_path):
+                        title = title_cache.get(test_path)
+                        if title is None:
+                            entry = self.zim_reader.archive.get_entry_by_path(test_path)
+                            title = self.zim_reader._safe_get_attribute(entry, 'title', test_path)
+                            title_cache[test_path] = title
+                        matches.setdefault(test_path, ArticleHit(title, test_path, method='pattern_match'))
+                        print(f"✓ Found via pattern: '{test_path}' -> '{title}'")
                 except:
-                    print(f"     Status: ? Unknown")
-                print()
-        else:
-            print("No matches found.")
-            print("The article might be:")
-            print("1. Stored under a completely different name")
-            print("2. Not present in this ZIM file")
-            print("3. Using a naming convention not covered by the search")
-            print("\nTry: 'debug <number>' on a search result to see what's actually returned")
-
-    def _handle_debug_search_result(self, search_results: List[Dict], article_index: int):
+                    continue
+        
+        return matches
+    
+    def _find_cache_db(self):
+        """Open the persistent find cache, or return None if it can't be used"""
+        if self._find_db is None:
+            try:
+                # Rows are keyed on the file's mtime, so a replaced ZIM
+                # file simply stops matching its old entries
+                path = self.zim_reader.zim_file_path
+                stamp = f"{FIND_CACHE_VERSION}:{os.path.realpath(path)}:{os.path.getmtime(path)}"
+                self._find_zim_id = hashlib.blake2b(stamp.encode(), digest_size=8).hexdigest()
+                db = sqlite3.connect(FIND_CACHE_FILE)
+                db.execute("CREATE TABLE IF NOT EXISTS find_cache ("
+                           "zim_id TEXT, q TEXT, matches TEXT, PRIMARY KEY (zim_id, q))")
+                self._find_db = db
+            except (sqlite3.Error, OSError) as e:
+                print(f"Warning: find cache unavailable: {e}")
+                self._find_db = False
+        return self._find_db or None
+    
+    def _find_cache_get(self, query: str):
+        """Return cached find matches for a query, or None"""
+        db = self._find_cache_db()
+        if db is None:
+            return None
+        try:
+            row = db.execute("SELECT matches FROM find_cache WHERE zim_id = ? AND q = ?",
+                             (self._find_zim_id, query)).fetchone()
+        except sqlite3.Error:
+            return None
+        if not row:
+            return None
+        # Stored as [title, path, method] rows, in report order
+        try:
+            return {path: ArticleHit(title, path, method=method) for title, path, method in json.loads(row[0])}
+        except (ValueError, TypeError):
+            return None
+    
+    def _find_cache_put(self, query: str, matches: Dict[str, ArticleHit]):
+        """Store find matches for a query"""
+        db = self._find_cache_db()
+        if db is None:
+            return
+        try:
+            with db:
+                db.execute("INSERT OR REPLACE INTO find_cache VALUES (?, ?, ?)",
+                           (self._find_zim_id, query,
+                            json.dumps([[m.title, m.path, m.method] for m in matches.values()])))
+        except sqlite3.Error:
+            pass
+    
+    def _safe_has_path(self, path: str) -> bool:
+        """Path probe for the thread pool - a failed lookup counts as missing"""
+        try:
+            return self._has_path(path)
+        except Exception:
+            return False
+    
+    def _handle_debug_search_result(self, search_results: List[ArticleHit], article_index: int):
         """Debug what a search result actually contains"""
         if not search_results:
             print("No search results available. Search first.")
@@ -488,20 +696,20 @@ class WikiConsoleInterface:
         
         result = search_results[article_index]
         print(f"\n=== Debugging Search Result #{article_index + 1} ===")
-        print(f"Title: '{result['title']}'")
-        print(f"Path: '{result['path']}'")
-        print(f"Snippet: '{result.get('snippet', 'N/A')}'")
-        print(f"URL: '{result.get('url', 'N/A')}'")
+        print(f"Title: '{result.title}'")
+        print(f"Path: '{result.path}'")
+        print(f"Snippet: '{result.snippet}'")
+        print(f"URL: '{result.url}'")
         
         # Test if the path exists
-        if result['path']:
+        if result.path:
             try:
-                exists = self.zim_reader.archive.has_entry_by_path(result['path'])
+                exists = self._has_path(result.path)
                 print(f"Path exists in archive: {exists}")
                 
                 if exists:
                     try:
-                        entry = self.zim_reader.archive.get_entry_by_path(result['path'])
+                        entry = self.zim_reader.archive.get_entry_by_path(result.path)
                         actual_title = self.zim_reader._safe_get_attribute(entry, 'title', 'Unknown')
                         actual_path = self.zim_reader._safe_get_attribute(entry, 'path', 'Unknown')
                         print(f"Actual entry title: '{actual_title}'")
@@ -533,7 +741,8 @@ class WikiConsoleInterface:
                         # Test content retrieval
                         try:
                             item = entry.get_item()
-                            content_length = len(bytes(item.content))
+                            # Size comes from the item header - no need to load the blob
+                            content_length = item.size
                             print(f"Content available: {content_length} bytes")
                         except Exception as e:
                             print(f"Error getting content: {e}")
@@ -545,23 +754,17 @@ class WikiConsoleInterface:
                     
                     # Try some variations
                     print("Trying path variations...")
-                    variations = [
-                        result['path'].replace('_', ' '),
-                        result['path'].replace(' ', '_'),
-                        result['path'].replace(':', '_'),
-                        result['path'].replace(':', ''),
-                        result['path'].replace("'", '_'),
-                        result['path'].replace("'", ''),
-                    ]
+                    path = result.path
+                    # Only substitutions whose character occurs can differ from the path
+                    variations = [path.replace(old, new) for old, new in _PATH_REPLACEMENTS if old in path]
                     
                     for var in variations:
-                        if var != result['path']:
-                            try:
-                                if self.zim_reader.archive.has_entry_by_path(var):
-                                    print(f"  ✓ Found variation: '{var}'")
-                                    break
-                            except:
-                                continue
+                        try:
+                            if self._has_path(var):
+                                print(f"  ✓ Found variation: '{var}'")
+                                break
+                        except:
+                            continue
                     else:
                         print("  No working variations found")
                         
@@ -618,13 +821,12 @@ class WikiConsoleInterface:
         except Exception as e:
             print(f"✗ Suggestions failed: {e}")
         
-        # Test 4: Direct path access
+        # Test 4: Direct path access (the paths found are reused by test 6)
+        found_paths = []
         try:
-            test_paths = ['A/Apple', 'A/Animal', 'F/France', 'P/Python', 'H/Hockey', 'M/Music']
-            found_paths = []
-            for path in test_paths:
+            for path in _TEST_PATHS:
                 try:
-                    if self.zim_reader.archive.has_entry_by_path(path):
+                    if self._has_path(path):
                         found_paths.append(path)
                 except:
                     continue
@@ -651,15 +853,13 @@ class WikiConsoleInterface:
         
         # Test 6: Content retrieval
         try:
-            # Try to get content from a known path
-            test_paths = ['A/Apple', 'A/Animal', 'F/France']
-            for path in test_paths:
+            # Try to get content from a path found in test 4
+            for path in found_paths:
                 try:
-                    if self.zim_reader.archive.has_entry_by_path(path):
-                        content = self.zim_reader.get_article_content(path, 100)
-                        if content and not content.startswith("Error"):
-                            print(f"✓ Content retrieval works (tested with {path})")
-                            break
+                    content = self.zim_reader.get_article_content(path, 100)
+                    if content and not content.startswith("Error"):
+                        print(f"✓ Content retrieval works (tested with {path})")
+                        break
                 except:
                     continue
             else:
@@ -669,12 +869,17 @@ class WikiConsoleInterface:
     
     def _show_info(self):
         """Show ZIM file information"""
-        print(f"Current ZIM: {self.zim_info['name']}")
-        print(f"Description: {self.zim_info['description']}")
-        print(f"File path: {self.zim_reader.zim_file_path}")
-        print(f"Default max chars: {self.default_max_chars}")
-        print(f"RF callsign: {self.rf_callsign}")
-        print("-" * 40)
+        # The file/config part never changes for a session - render it once
+        if self._info_header is None:
+            self._info_header = (
+                f"Current ZIM: {self.zim_info['name']}\n"
+                f"Description: {self.zim_info['description']}\n"
+                f"File path: {self.zim_reader.zim_file_path}\n"
+                f"Default max chars: {self.default_max_chars}\n"
+                f"RF callsign: {self.rf_callsign}\n"
+                + "-" * 40 + "\n"
+            )
+        sys.stdout.write(self._info_header)
         
         if self.zim_reader.archive:
             print(f"Entry count: {self.zim_reader.archive.entry_count}")
@@ -687,40 +892,4 @@ class WikiConsoleInterface:
     
     def _show_help(self):
         """Show help information"""
-        print("""
-Available Commands:
-  search <query>     - Search for articles (uses multiple search methods)
-  browse             - Browse available articles
-  read <number>      - Read full article by number from last results
-  read <number> <length> - Read article with custom length (e.g. read 1 5000)
-  read <number> all  - Read entire article with size confirmation
-  debug <number>     - Debug a specific search result to see what's wrong
-  find <n>        - Find how an article is actually stored
-  suggest <partial>  - Get article title suggestions
-  info               - Show information about the ZIM file
-  test               - Test libzim functionality and compatibility
-  help               - Show this help message
-  quit               - Exit the program
-
-Examples:
-  suggest hockey     # Find articles with "hockey" in title
-  search hockey      # Search for hockey-related articles
-  browse             # See what articles are available
-  read 1             # Read first result from last search/browse
-  find pink floyd    # See how Pink Floyd articles are stored
-
-Troubleshooting:
-  If "read" fails with "Article not found":
-  1. Use "debug <number>" to see what's wrong with a search result
-  2. Use "find <article_name>" to see the actual stored path
-  3. Try other articles from the search results
-  4. Use "browse" to find articles that definitely exist
-
-Features:
-- Multiple search methods (fulltext, suggestions, path guessing)
-- Robust error handling for different libzim versions
-- Content formatting optimized for console/RF display
-- Automatic fallback when search indices are unavailable
-
-This version includes improved error handling and compatibility fixes.
-        """)
+        sys.stdout.write(_HELP_TEXT)
@@ -2,9 +2,15 @@
 ZIM file reading and content extraction logic
 """
 
+import functools
+import html
+import logging
 import re
 import os
-from typing import List, Dict, Optional
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     from libzim.reader import Archive
@@ -15,6 +21,90 @@ except ImportError:
     LIBZIM_AVAILABLE = False
     print("Warning: python-libzim not installed. Install with: pip install libzim")
 
+# Per-entry/per-result diagnostics; the console is the user's session,
+# so these stay off it unless debug logging is configured
+log = logging.getLogger(__name__)
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # fall back to the regex HTML cleaner
+    lxml_html = None
+
+# Header tags rendered as "=== title ===" in article text
+HEADER_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# Patterns for HTML cleanup, sentence splitting and path sanitizing, compiled once
+# (tags sharing a replacement share one alternation, so one pass each)
+_RE_SCRIPT_STYLE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_RE_HEADER = re.compile(r'<h([1-6])[^>]*>(.*?)</h\1>', re.DOTALL)
+_RE_BLOCK_BREAK = re.compile(r'<p[^>]*>|<br[^>]*/?>|<[/]?[ou]l[^>]*>')
+_RE_LI_OPEN = re.compile(r'<li[^>]*>')
+_RE_BLOCK_CLOSE = re.compile(r'</(?:p|li)>')
+_RE_TAG = re.compile(r'<[^>]+>')
+_RE_SPACES = re.compile(r'[ \t]+')
+_RE_SENTENCE = re.compile(r'[^.!?]*[.!?]+')
+_RE_SAFE_PATH = re.compile(r'[^\w\s/]')
+
+# Character swaps tried when a search result's path is missing from the archive
+_PATH_REPLACEMENTS = (('_', ' '), (' ', '_'), (':', '_'), (':', ''),
+                      ("'", '_'), ("'", ''), ('"', '_'), ('"', ''))
+
+# Well-known articles tried by the browse fallback, in display order
+COMMON_ARTICLES = (
+    'A/Albert_Einstein', 'A/Apple', 'A/Art', 'A/Animal', 'A/Africa',
+    'B/Biology', 'B/Book', 'B/Bird', 'B/Brazil',
+    'C/Computer', 'C/Cat', 'C/City', 'C/Culture', 'C/Canada',
+    'D/Dog', 'D/Dance', 'D/Democracy', 'D/DNA',
+    'E/Earth', 'E/Education', 'E/Energy', 'E/Europe',
+    'F/France', 'F/Food', 'F/Fish', 'F/Football',
+    'G/Germany', 'G/Game', 'G/Geography', 'G/Guitar',
+    'H/History', 'H/Human', 'H/Health', 'H/Hockey',
+    'I/Internet', 'I/Italy', 'I/India', 'I/Islam',
+    'J/Japan', 'J/Jazz', 'J/Jupiter', 'J/Jesus',
+    'M/Music', 'M/Mathematics', 'M/Medicine', 'M/Moon',
+    'P/Physics', 'P/Python_(programming_language)', 'P/Philosophy', 'P/Paris',
+    'S/Science', 'S/Space', 'S/Sport', 'S/Sun',
+    'T/Technology', 'T/Tree', 'T/Time', 'T/Tennis',
+    'W/Water', 'W/World', 'W/Wikipedia', 'W/War'
+)
+
+# Worker threads used for alternative-search probes when parallel_probe is on
+PROBE_WORKERS = 4
+
+# Entries the last-resort title match in get_article_content looks through
+FALLBACK_SCAN_LIMIT = 2000
+
+def _path_variations(path: str) -> List[str]:
+    """Alternative spellings of path, skipping swaps that would not change it"""
+    return [path.replace(old, new) for old, new in _PATH_REPLACEMENTS if old in path]
+
+class ArticleHit:
+    """A search, browse or find result (slotted - result lists can be long)
+    
+    snippet may also be a zero-argument callable; it is then only called,
+    once, if the snippet is actually read.
+    """
+    
+    __slots__ = ('title', 'path', '_snippet', 'url', 'method')
+    
+    def __init__(self, title: str, path: str, snippet: Union[str, Callable[[], str]] = '',
+                 url: str = '', method: str = ''):
+        self.title = title
+        self.path = path
+        self._snippet = snippet
+        self.url = url
+        self.method = method
+    
+    @property
+    def snippet(self) -> str:
+        if not isinstance(self._snippet, str):
+            self._snippet = self._snippet()
+        return self._snippet
+    
+    @snippet.setter
+    def snippet(self, value: str):
+        self._snippet = value
+
 class WikiZimReader:
     """Interface for reading Wikipedia ZIM files offline"""
     
@@ -30,12 +120,24 @@ class WikiZimReader:
         self.archive = None
         self.searcher = None
         self.suggestion_searcher = None
+        # Normalized titles/paths for the last-resort lookup, built on first miss
+        self._title_index = None
+        # (type, attribute name) -> True if the attribute is a method
+        self._attr_kinds = {}
+        # Alternative-path rewrite kind -> number of articles it has found
+        self._alt_path_hits = {}
+        # Probe alternative-search candidates on a thread pool; only pays
+        # off if the libzim build releases the GIL on lookups
+        self.parallel_probe = False
         self._load_archive()
     
     def _load_archive(self):
         """Load the ZIM archive and initialize searchers"""
         try:
             self.archive = Archive(self.zim_file_path)
+            # Search, browse and lookups probe the same paths over and over;
+            # remember the answers instead of crossing into libzim each time
+            self._has_path = functools.lru_cache(maxsize=4096)(self.archive.has_entry_by_path)
             
             # Only initialize searchers if indices are available
             if self.archive.has_fulltext_index:
@@ -64,117 +166,77 @@ class WikiZimReader:
         except Exception as e:
             raise Exception(f"Failed to load ZIM file: {e}")
     
-    def browse_articles(self, max_results: int = 20) -> List[Dict]:
+    def browse_articles(self, max_results: int = 20) -> List[ArticleHit]:
         """Browse available articles using iterator"""
-        results = []
         try:
             print("Browsing articles using iterator...")
             
-            count = 0
-            for entry in self.archive:
-                if count >= max_results:
-                    break
-                    
-                try:
-                    # Check if it's an article entry
-                    if hasattr(entry, 'is_article') and entry.is_article():
-                        title = self._safe_get_attribute(entry, 'title', 'Unknown')
-                        path = self._safe_get_attribute(entry, 'path', '')
-                        
-                        # Skip empty titles or system entries
-                        if title and not title.startswith(('-/', '_')):
-                            results.append({
-                                'title': title,
-                                'path': path,
-                                'snippet': f"Article entry",
-                                'url': path
-                            })
-                            count += 1
-                    else:
-                        # Fallback for entries without is_article method
-                        title = self._safe_get_attribute(entry, 'title', '')
-                        path = self._safe_get_attribute(entry, 'path', '')
-                        
-                        # Skip system entries and empty titles
-                        if title and not title.startswith(('-/', '_', 'File:', 'Category:')):
-                            results.append({
-                                'title': title,
-                                'path': path,
-                                'snippet': f"Entry",
-                                'url': path
-                            })
-                            count += 1
-                        
-                except Exception as e:
-                    # Log error but continue processing
-                    print(f"Warning: Error processing entry: {e}")
-                    continue
+            # Entries are verified as they are read, so the scan stops as
+            # soon as max_results accessible articles have turned up
+            results = list(islice(self._iter_browse(), max_results))
             
             print(f"Found {len(results)} browseable articles")
-            
-            # Filter out phantom results here too
-            verified_results = []
-            for result in results:
-                if result['path']:
-                    try:
-                        if self.archive.has_entry_by_path(result['path']):
-                            verified_results.append(result)
-                    except:
-                        continue
-            
-            if len(verified_results) < len(results):
-                print(f"Filtered to {len(verified_results)} verified accessible articles")
-                results = verified_results
-            
             return results
             
         except Exception as e:
             print(f"Browse error: {e}")
             return self._browse_by_path()
     
-    def _browse_by_path(self) -> List[Dict]:
+    def _iter_browse(self) -> Iterator[ArticleHit]:
+        """Yield browseable articles that really exist, in archive order"""
+        for entry in self.archive:
+            hit = None
+            try:
+                # Check if it's an article entry
+                if hasattr(entry, 'is_article') and entry.is_article():
+                    title = self._safe_get_attribute(entry, 'title', 'Unknown')
+                    path = self._safe_get_attribute(entry, 'path', '')
+                    
+                    # Skip empty titles or system entries
+                    if title and not title.startswith(('-/', '_')):
+                        hit = ArticleHit(title, path, f"Article entry", path)
+                else:
+                    # Fallback for entries without is_article method
+                    title = self._safe_get_attribute(entry, 'title', '')
+                    path = self._safe_get_attribute(entry, 'path', '')
+                    
+                    # Skip system entries and empty titles
+                    if title and not title.startswith(('-/', '_', 'File:', 'Category:')):
+                        hit = ArticleHit(title, path, f"Entry", path)
+                
+                # Filter out phantom entries here too
+                if hit and not (path and self._has_path(path)):
+                    hit = None
+                    
+            except Exception as e:
+                # Log error but continue processing
+                log.debug("Error processing entry: %s", e)
+                continue
+            
+            if hit:
+                yield hit
+    
+    def _browse_by_path(self) -> List[ArticleHit]:
         """Alternative browse method by trying common paths"""
         results = []
-        common_articles = [
-            'A/Albert_Einstein', 'A/Apple', 'A/Art', 'A/Animal', 'A/Africa',
-            'B/Biology', 'B/Book', 'B/Bird', 'B/Brazil',
-            'C/Computer', 'C/Cat', 'C/City', 'C/Culture', 'C/Canada',
-            'D/Dog', 'D/Dance', 'D/Democracy', 'D/DNA',
-            'E/Earth', 'E/Education', 'E/Energy', 'E/Europe',
-            'F/France', 'F/Food', 'F/Fish', 'F/Football',
-            'G/Germany', 'G/Game', 'G/Geography', 'G/Guitar',
-            'H/History', 'H/Human', 'H/Health', 'H/Hockey',
-            'I/Internet', 'I/Italy', 'I/India', 'I/Islam',
-            'J/Japan', 'J/Jazz', 'J/Jupiter', 'J/Jesus',
-            'M/Music', 'M/Mathematics', 'M/Medicine', 'M/Moon',
-            'P/Physics', 'P/Python_(programming_language)', 'P/Philosophy', 'P/Paris',
-            'S/Science', 'S/Space', 'S/Sport', 'S/Sun',
-            'T/Technology', 'T/Tree', 'T/Time', 'T/Tennis',
-            'W/Water', 'W/World', 'W/Wikipedia', 'W/War'
-        ]
         
         print("Trying common article paths...")
-        for path in common_articles:
+        for path in COMMON_ARTICLES:
             try:
-                if self.archive.has_entry_by_path(path):
+                if self._has_path(path):
                     entry = self.archive.get_entry_by_path(path)
                     title = self._safe_get_attribute(entry, 'title', path.split('/')[-1])
                     
-                    results.append({
-                        'title': title,
-                        'path': path,
-                        'snippet': f"Found by path: {path}",
-                        'url': path
-                    })
+                    results.append(ArticleHit(title, path, f"Found by path: {path}", path))
                     if len(results) >= 20:
                         break
             except Exception as e:
-                print(f"Warning: Error checking path {path}: {e}")
+                log.debug("Error checking path %s: %s", path, e)
                 continue
         
         return results
     
-    def search_articles(self, query: str, max_results: int = 10) -> List[Dict]:
+    def search_articles(self, query: str, max_results: int = 10) -> List[ArticleHit]:
         """Search for articles matching the query"""
         if not query.strip():
             return []
@@ -223,7 +285,9 @@ class WikiZimReader:
                                 
                                 title = self._safe_get_attribute(entry, 'title', 'Unknown')
                                 path = self._safe_get_attribute(entry, 'path', '')
-                                snippet = self._safe_get_attribute(entry, 'snippet', '')
+                                # Highlighted snippets are costly to build - only
+                                # produce them for results that get displayed
+                                snippet = functools.partial(self._safe_get_attribute, entry, 'snippet', '')
                                 
                                 # Fix: If path is empty but title looks like a path, use title as path
                                 if not path and title and ('/' in title or title.startswith('A/')):
@@ -232,15 +296,10 @@ class WikiZimReader:
                                     # Try to construct a reasonable path from title
                                     path = f"A/{title.replace(' ', '_')}"
                                 
-                                results.append({
-                                    'title': title,
-                                    'path': path,
-                                    'snippet': snippet,
-                                    'url': path
-                                })
+                                results.append(ArticleHit(title, path, snippet, path))
                                 result_count += 1
                             except Exception as e:
-                                print(f"Warning: Error accessing result {i}: {e}")
+                                log.debug("Error accessing result %d: %s", i, e)
                                 continue
                                 
                     except Exception as e:
@@ -255,7 +314,7 @@ class WikiZimReader:
                             
                             title = self._safe_get_attribute(entry, 'title', 'Unknown')
                             path = self._safe_get_attribute(entry, 'path', '')
-                            snippet = self._safe_get_attribute(entry, 'snippet', '')
+                            snippet = functools.partial(self._safe_get_attribute, entry, 'snippet', '')
                             
                             # Fix: If path is empty but title looks like a path, use title as path
                             if not path and title and ('/' in title or title.startswith('A/')):
@@ -264,12 +323,7 @@ class WikiZimReader:
                                 # Try to construct a reasonable path from title
                                 path = f"A/{title.replace(' ', '_')}"
                             
-                            results.append({
-                                'title': title,
-                                'path': path,
-                                'snippet': snippet,
-                                'url': path
-                            })
+                            results.append(ArticleHit(title, path, snippet, path))
                             result_count += 1
                             
                     except Exception as e:
@@ -287,7 +341,7 @@ class WikiZimReader:
             print(f"Found {len(results)} results from fulltext search")
             
             # Filter out phantom results
-            results = self._filter_phantom_results(results)
+            results = self._filter_phantom_results(results, max_results)
             
             # If search didn't work or no verified results, try alternative methods
             if len(results) == 0:
@@ -300,8 +354,12 @@ class WikiZimReader:
             print(f"Search error: {e}")
             return self._alternative_search(query, max_results)
     
-    def _filter_phantom_results(self, results: List[Dict]) -> List[Dict]:
-        """Filter out search results that don't actually exist in the archive"""
+    def _filter_phantom_results(self, results: List[ArticleHit],
+                                max_results: Optional[int] = None) -> List[ArticleHit]:
+        """Filter out search results that don't actually exist in the archive
+        
+        Verification stops once max_results accessible results are found.
+        """
         if not results:
             return results
             
@@ -309,48 +367,39 @@ class WikiZimReader:
         verified_results = []
         
         for i, result in enumerate(results):
-            print(f"Testing result {i+1}: '{result['title']}' -> '{result['path']}'")
-            if result['path']:
+            if max_results is not None and len(verified_results) >= max_results:
+                break
+            log.debug("Testing result %d: %r -> %r", i + 1, result.title, result.path)
+            if result.path:
                 try:
                     # Check if the path actually exists
-                    if self.archive.has_entry_by_path(result['path']):
-                        print(f"  ✓ Path exists")
+                    if self._has_path(result.path):
+                        log.debug("  Path exists")
                         verified_results.append(result)
                     else:
-                        print(f"  ✗ Path does not exist, trying variations...")
+                        log.debug("  Path does not exist, trying variations")
                         # Try to find a working alternative
                         alternative_found = False
-                        variations = [
-                            result['path'].replace('_', ' '),
-                            result['path'].replace(' ', '_'),
-                            result['path'].replace(':', '_'),
-                            result['path'].replace(':', ''),
-                            result['path'].replace("'", '_'),
-                            result['path'].replace("'", ''),
-                            result['path'].replace('"', '_'),
-                            result['path'].replace('"', ''),
-                        ]
                         
-                        for variation in variations:
-                            if variation != result['path']:
-                                try:
-                                    if self.archive.has_entry_by_path(variation):
-                                        print(f"  ✓ Found working variation: '{variation}'")
-                                        # Update the result with the working path
-                                        result['path'] = variation
-                                        result['url'] = variation
-                                        verified_results.append(result)
-                                        alternative_found = True
-                                        break
-                                except:
-                                    continue
+                        for variation in _path_variations(result.path):
+                            try:
+                                if self._has_path(variation):
+                                    log.debug("  Found working variation: %r", variation)
+                                    # Update the result with the working path
+                                    result.path = variation
+                                    result.url = variation
+                                    verified_results.append(result)
+                                    alternative_found = True
+                                    break
+                            except:
+                                continue
                         
                         if not alternative_found:
-                            print(f"  ✗ No working variations found - skipping")
+                            log.debug("  No working variations found - skipping")
                 except Exception as e:
-                    print(f"  ✗ Error testing path: {e}")
+                    log.debug("  Error testing path: %s", e)
             else:
-                print(f"  ✗ Empty path - skipping")
+                log.debug("  Empty path - skipping")
         
         print(f"Final result: {len(verified_results)} verified accessible articles out of {len(results)} total")
         return verified_results
@@ -358,18 +407,27 @@ class WikiZimReader:
     def _safe_get_attribute(self, obj, attr_name: str, default: str = '') -> str:
         """Safely get an attribute value, handling both properties and methods"""
         try:
-            if hasattr(obj, attr_name):
-                attr = getattr(obj, attr_name)
-                if callable(attr):
-                    return str(attr())
-                else:
-                    return str(attr)
+            # libzim types have a fixed schema, so whether an attribute is a
+            # method or a property is worked out once per (type, name)
+            key = (type(obj), attr_name)
+            is_method = self._attr_kinds.get(key)
+            if is_method is None:
+                if not hasattr(obj, attr_name):
+                    return default
+                is_method = self._attr_kinds[key] = callable(getattr(obj, attr_name))
+            
+            value = getattr(obj, attr_name)
+            if is_method:
+                value = value()
+            # libzim already hands back str for titles and paths
+            return value if type(value) is str else str(value)
+        except AttributeError:
             return default
         except Exception as e:
-            print(f"Warning: Error getting {attr_name}: {e}")
+            log.debug("Error getting %s: %s", attr_name, e)
             return default
     
-    def _alternative_search(self, query: str, max_results: int = 10) -> List[Dict]:
+    def _alternative_search(self, query: str, max_results: int = 10) -> List[ArticleHit]:
         """Alternative search methods when fulltext search fails"""
         print("Using alternative search approaches...")
         
@@ -382,27 +440,29 @@ class WikiZimReader:
                 for word in query_words:
                     if len(word) > 2:  # Skip very short words
                         suggestions = self.get_suggestions(word, max_results * 2)
+                        matching = [suggestion for suggestion in suggestions
+                                    if any(q_word in suggestion.lower() for q_word in query_words)]
                         
-                        for suggestion in suggestions:
-                            if any(q_word in suggestion.lower() for q_word in query_words):
-                                # Try to find the actual article
-                                potential_paths = self._generate_potential_paths(suggestion)
-                                
-                                for path in potential_paths:
-                                    try:
-                                        if self.archive.has_entry_by_path(path):
-                                            results.append({
-                                                'title': suggestion,
-                                                'path': path,
-                                                'snippet': f"Found via suggestions for '{word}'",
-                                                'url': path
-                                            })
-                                            break
-                                    except:
-                                        continue
-                                        
-                                if len(results) >= max_results:
-                                    break
+                        # Check this word's candidate paths concurrently up
+                        # front; the loop below then reads cached answers
+                        if self.parallel_probe:
+                            self._probe_paths([path for suggestion in matching
+                                               for path in self._generate_potential_paths(suggestion)])
+                        
+                        for suggestion in matching:
+                            # Try to find the actual article
+                            potential_paths = self._generate_potential_paths(suggestion)
+                            
+                            for path in potential_paths:
+                                try:
+                                    if self._has_path(path):
+                                        results.append(ArticleHit(suggestion, path, f"Found via suggestions for '{word}'", path))
+                                        break
+                                except:
+                                    continue
+                                    
+                            if len(results) >= max_results:
+                                break
                         
                         if len(results) >= max_results:
                             break
@@ -417,6 +477,18 @@ class WikiZimReader:
         
         return results
     
+    def _probe_paths(self, paths: List[str]) -> None:
+        """Warm the _has_path cache for paths using a thread pool"""
+        def probe(path):
+            try:
+                return self._has_path(path)
+            except Exception:
+                return False  # not cached - the caller's own probe reports it
+        
+        with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+            for _ in executor.map(probe, dict.fromkeys(paths)):
+                pass
+    
     def _generate_potential_paths(self, title: str) -> List[str]:
         """Generate potential article paths for a title"""
         title_clean = title.replace(' ', '_')
@@ -431,13 +503,14 @@ class WikiZimReader:
             title
         ]
     
-    def _search_by_path_guessing(self, query: str, max_results: int = 10) -> List[Dict]:
+    def _search_by_path_guessing(self, query: str, max_results: int = 10) -> List[ArticleHit]:
         """Search by guessing article paths"""
         results = []
         query_words = [word.strip() for word in query.split() if len(word.strip()) > 2]
         
-        # Generate potential article paths
-        potential_articles = []
+        # Generate potential article paths (a dict keeps first-seen order
+        # and drops repeats as they are added)
+        potential_articles = {}
         
         for word in query_words:
             word_variations = [
@@ -448,11 +521,8 @@ class WikiZimReader:
             ]
             
             for variation in word_variations:
-                potential_articles.extend([
-                    f"{variation[0].upper()}/{variation}",
-                    f"A/{variation}",
-                    variation
-                ])
+                for path in (f"{variation[0].upper()}/{variation}", f"A/{variation}", variation):
+                    potential_articles[path] = None
         
         # Try combinations of words
         if len(query_words) > 1:
@@ -461,34 +531,18 @@ class WikiZimReader:
                     combined_words = query_words[i:j]
                     combined = "_".join(word.capitalize() for word in combined_words)
                     
-                    potential_articles.extend([
-                        f"{combined[0]}/{combined}",
-                        f"A/{combined}",
-                        combined
-                    ])
+                    for path in (f"{combined[0]}/{combined}", f"A/{combined}", combined):
+                        potential_articles[path] = None
         
-        print(f"Trying {len(set(potential_articles))} potential paths...")
+        print(f"Trying {len(potential_articles)} potential paths...")
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_articles = []
         for path in potential_articles:
-            if path not in seen:
-                seen.add(path)
-                unique_articles.append(path)
-        
-        for path in unique_articles:
             try:
-                if self.archive.has_entry_by_path(path):
+                if self._has_path(path):
                     entry = self.archive.get_entry_by_path(path)
                     title = self._safe_get_attribute(entry, 'title', path.split('/')[-1])
                     
-                    results.append({
-                        'title': title,
-                        'path': path,
-                        'snippet': f"Found by path guessing: {path}",
-                        'url': path
-                    })
+                    results.append(ArticleHit(title, path, f"Found by path guessing: {path}", path))
                     
                     if len(results) >= max_results:
                         break
@@ -502,86 +556,32 @@ class WikiZimReader:
         """Get article content by path, formatted for text display"""
         try:
             # Try the path as-is first
-            if self.archive.has_entry_by_path(article_path):
+            if self._has_path(article_path):
                 entry = self.archive.get_entry_by_path(article_path)
             else:
                 # Try alternative path formats
-                alternative_paths = []
-                
-                # If path starts with a letter and slash, try without the prefix
-                if '/' in article_path and len(article_path.split('/')) == 2:
-                    alternative_paths.append(article_path.split('/', 1)[1])
-                
-                # Try with 'A/' prefix if not already there
-                if not article_path.startswith('A/'):
-                    alternative_paths.append(f"A/{article_path}")
-                
-                # Try URL decoding in case of encoded characters
-                try:
-                    import urllib.parse
-                    decoded_path = urllib.parse.unquote(article_path)
-                    if decoded_path != article_path:
-                        alternative_paths.append(decoded_path)
-                except:
-                    pass
-                
-                # Try replacing underscores with spaces and vice versa
-                if '_' in article_path:
-                    alternative_paths.append(article_path.replace('_', ' '))
-                if ' ' in article_path:
-                    alternative_paths.append(article_path.replace(' ', '_'))
-                
-                # Try handling special characters (colons, apostrophes, etc.)
-                if ':' in article_path:
-                    alternative_paths.append(article_path.replace(':', '_'))
-                    alternative_paths.append(article_path.replace(':', ''))
-                if "'" in article_path:
-                    alternative_paths.append(article_path.replace("'", '_'))
-                    alternative_paths.append(article_path.replace("'", ''))
-                if '"' in article_path:
-                    alternative_paths.append(article_path.replace('"', '_'))
-                    alternative_paths.append(article_path.replace('"', ''))
-                
-                # Try URL-safe versions
-                safe_path = re.sub(r'[^\w\s/]', '_', article_path)
-                if safe_path != article_path:
-                    alternative_paths.append(safe_path)
-                
                 entry = None
-                for alt_path in alternative_paths:
+                for kind, alt_path in self._alternative_paths(article_path):
                     try:
-                        if self.archive.has_entry_by_path(alt_path):
+                        if self._has_path(alt_path):
                             entry = self.archive.get_entry_by_path(alt_path)
                             article_path = alt_path  # Update for redirect handling
+                            self._alt_path_hits[kind] = self._alt_path_hits.get(kind, 0) + 1
                             break
                     except Exception:
                         continue
                 
                 if not entry:
-                    # Last resort: try to find by iterating through archive
+                    # Last resort: match the name against the indexed titles/paths
                     article_name = article_path.split('/')[-1] if '/' in article_path else article_path
                     
-                    try:
-                        count = 0
-                        for archive_entry in self.archive:
-                            if count > 2000:  # Increased search limit
-                                break
-                            try:
-                                entry_title = self._safe_get_attribute(archive_entry, 'title', '')
-                                entry_path = self._safe_get_attribute(archive_entry, 'path', '')
-                                
-                                # More flexible matching
-                                if (article_name.lower().replace('_', ' ') in entry_title.lower().replace('_', ' ') or
-                                    article_name.lower().replace(' ', '_') in entry_path.lower().replace(' ', '_') or
-                                    entry_title.lower().replace('_', ' ') == article_name.lower().replace('_', ' ')):
-                                    entry = archive_entry
-                                    article_path = entry_path
-                                    break
-                                count += 1
-                            except:
-                                continue
-                    except Exception:
-                        pass
+                    found_path = self._lookup_title_index(article_name)
+                    if found_path:
+                        try:
+                            entry = self.archive.get_entry_by_path(found_path)
+                            article_path = found_path
+                        except Exception:
+                            pass
                 
                 if not entry:
                     return f"Article not found: '{article_path}'"
@@ -614,24 +614,21 @@ class WikiZimReader:
             try:
                 item = entry.get_item()
                 content_data = item.content
-                
-                # Handle different content data types
-                if hasattr(content_data, 'tobytes'):
-                    # If it's a memoryview or similar
-                    content_bytes = content_data.tobytes()
-                elif isinstance(content_data, (bytes, bytearray)):
-                    content_bytes = bytes(content_data)
-                else:
-                    # Try to convert to bytes
-                    content_bytes = bytes(content_data)
-                
-                content = content_bytes.decode('utf-8', errors='replace')
+
+                # item.content is a memoryview onto libzim's mapped cluster
+                # data - decode straight from the buffer instead of copying
+                # it into an intermediate bytes object first
+                try:
+                    content = str(content_data, 'utf-8', 'replace')
+                except TypeError:
+                    # Not a buffer - try to convert to bytes
+                    content = bytes(content_data).decode('utf-8', errors='replace')
                 
             except Exception as e:
                 return f"Error retrieving content: {e}"
             
             # Convert HTML to text
-            text_content = self._html_to_text(content)
+            text_content = self._html_to_text(content, max_chars)
             
             # Truncate if too long (only if max_chars is specified)
             if max_chars is not None and len(text_content) > max_chars:
@@ -642,58 +639,140 @@ class WikiZimReader:
         except Exception as e:
             return f"Error retrieving article '{article_path}': {e}"
     
-    def _html_to_text(self, html_content: str) -> str:
-        """Convert HTML content to readable text"""
+    def _alternative_paths(self, article_path: str) -> List[Tuple[object, str]]:
+        """Other spellings of a missing path as (kind, path), likeliest first"""
+        candidates = []
+        
+        # If path starts with a letter and slash, try without the prefix
+        if '/' in article_path and len(article_path.split('/')) == 2:
+            candidates.append(('strip_prefix', article_path.split('/', 1)[1]))
+        
+        # Try with 'A/' prefix if not already there
+        if not article_path.startswith('A/'):
+            candidates.append(('add_prefix', f"A/{article_path}"))
+        
+        # Try URL decoding in case of encoded characters
+        if '%' in article_path:
+            try:
+                decoded_path = urllib.parse.unquote(article_path)
+                if decoded_path != article_path:
+                    candidates.append(('unquote', decoded_path))
+            except:
+                pass
+        
+        # Underscores vs spaces, then colons, apostrophes and quotes
+        for old, new in _PATH_REPLACEMENTS:
+            if old in article_path:
+                candidates.append(((old, new), article_path.replace(old, new)))
+        
+        # Try URL-safe versions
+        if _RE_SAFE_PATH.search(article_path):
+            candidates.append(('sanitize', _RE_SAFE_PATH.sub('_', article_path)))
+        
+        # An archive names its entries one way, so the kinds of rewrite that
+        # have found articles before go first (the sort is stable - untried
+        # kinds keep the order above)
+        hits = self._alt_path_hits
+        if hits:
+            candidates.sort(key=lambda candidate: -hits.get(candidate[0], 0))
+        return candidates
+    
+    def _build_title_index(self) -> Tuple[Dict[str, str], List[Tuple[str, str, str]]]:
+        """Normalize the first archive entries' titles and paths once"""
+        exact = {}
+        entries = []
+        try:
+            for archive_entry in islice(self.archive, FALLBACK_SCAN_LIMIT):
+                try:
+                    entry_title = self._safe_get_attribute(archive_entry, 'title', '')
+                    entry_path = self._safe_get_attribute(archive_entry, 'path', '')
+                except Exception:
+                    continue
+                if not entry_path:
+                    continue
+                
+                title_key = entry_title.lower().replace('_', ' ')
+                entries.append((title_key, entry_path.lower().replace(' ', '_'), entry_path))
+                # Titles win over paths for the exact-match lookup
+                exact.setdefault(title_key, entry_path)
+        except Exception:
+            pass
+        for title_key, path_key, entry_path in entries:
+            exact.setdefault(path_key.replace('_', ' '), entry_path)
+        return exact, entries
+    
+    def _lookup_title_index(self, article_name: str) -> Optional[str]:
+        """Find an entry path whose title or path matches article_name"""
+        if self._title_index is None:
+            self._title_index = self._build_title_index()
+        exact, entries = self._title_index
+        
+        name = article_name.lower()
+        name_spaced = name.replace('_', ' ')
+        found_path = exact.get(name_spaced)
+        if found_path:
+            return found_path
+        
+        # More flexible matching: the name inside a title or path
+        name_underscored = name.replace(' ', '_')
+        for title_key, path_key, entry_path in entries:
+            if name_spaced in title_key or name_underscored in path_key:
+                return entry_path
+        return None
+    
+    def _html_to_text(self, html_content: str, max_chars: Optional[int] = None) -> str:
+        """Convert HTML content to readable text
+        
+        With max_chars set, sentence splitting stops once the text is
+        longer than that, leaving the caller's truncation a short tail.
+        """
         if not html_content:
             return "No content available."
-            
-        # Remove script and style elements
-        html_content = re.sub(r'<script[^>]*>.*?</script>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
-        html_content = re.sub(r'<style[^>]*>.*?</style>', '', html_content, flags=re.DOTALL | re.IGNORECASE)
         
-        # Convert headers to text format
-        html_content = re.sub(r'<h([1-6])[^>]*>(.*?)</h\1>', r'\n\n\n=== \2 ===\n\n', html_content, flags=re.DOTALL)
-        
-        # Handle paragraphs and line breaks
-        html_content = re.sub(r'<p[^>]*>', '\n\n', html_content)
-        html_content = re.sub(r'</p>', '', html_content)
-        html_content = re.sub(r'<br[^>]*/?>', '\n\n', html_content)
+        # Flatten the markup with lxml's C parser when it is installed,
+        # otherwise (or if the document won't parse) with regexes
+        text = None
+        if lxml_html is not None:
+            try:
+                text = self._flatten_html_lxml(html_content)
+            except Exception:
+                text = None
+        if text is None:
+            text = self._flatten_html_regex(html_content)
         
-        # Convert lists
-        html_content = re.sub(r'<li[^>]*>', '\n\n• ', html_content)
-        html_content = re.sub(r'</li>', '', html_content)
-        html_content = re.sub(r'<[/]?[ou]l[^>]*>', '\n\n', html_content)
+        # Join sentences with double line breaks for RF readability
+        parts = []
+        length = -2  # no break before the first sentence
+        for sentence in self._split_sentences(text):
+            sentence = sentence.strip()
+            if sentence:
+                parts.append(sentence)
+                length += len(sentence) + 2
+                # Past the budget - the rest would only be cut off again
+                if max_chars is not None and length > max_chars:
+                    break
         
-        # Remove all remaining HTML tags
-        html_content = re.sub(r'<[^>]+>', '', html_content)
-        
-        # Decode HTML entities
-        html_content = html_content.replace('&amp;', '&')
-        html_content = html_content.replace('&lt;', '<')
-        html_content = html_content.replace('&gt;', '>')
-        html_content = html_content.replace('&quot;', '"')
-        html_content = html_content.replace('&#39;', "'")
-        html_content = html_content.replace('&nbsp;', ' ')
-        
-        # Clean up whitespace first
-        html_content = re.sub(r'[ \t]+', ' ', html_content)
-        html_content = re.sub(r' *\n *', '\n', html_content)
-        
-        # Split into sentences and add spacing for RF readability
-        sentences = []
+        return "\n\n".join(parts)
+    
+    def _split_sentences(self, text: str) -> Iterator[str]:
+        """Yield headers, list items and sentences from flattened text, in order"""
         current_sentence = ""
         
-        for line in html_content.split('\n'):
+        for line in text.split('\n'):
+            # Whitespace is cleaned up line by line, so text past a
+            # max_chars budget is never touched
             line = line.strip()
             if not line:
                 continue
+            if '  ' in line or '\t' in line:
+                line = _RE_SPACES.sub(' ', line)
                 
             # Handle headers (lines with ===)
             if line.startswith('===') and line.endswith('==='):
                 if current_sentence:
-                    sentences.append(current_sentence.strip())
+                    yield current_sentence.strip()
                     current_sentence = ""
-                sentences.append(line)
+                yield line
                 continue
             
             # Handle list items - skip empty ones
@@ -702,34 +781,87 @@ class WikiZimReader:
                 list_content = line[1:].strip()  # Remove bullet and whitespace
                 if list_content:  # Only if there's actual content after the bullet
                     if current_sentence:
-                        sentences.append(current_sentence.strip())
+                        yield current_sentence.strip()
                         current_sentence = ""
-                    sentences.append(line)
+                    yield line
                 continue
             
             # Accumulate text for sentence detection
             current_sentence += " " + line
             
-            # Look for sentence endings
-            sentence_endings = re.findall(r'[^.!?]*[.!?]+', current_sentence)
-            if sentence_endings:
-                for ending in sentence_endings:
-                    sentences.append(ending.strip())
+            # Look for sentence endings. The carried-over text never holds
+            # one, so only a line with a terminator can complete a sentence
+            if '.' in line or '!' in line or '?' in line:
+                # The matches run back to back from the start, so whatever
+                # follows the last one is the remainder
+                end = 0
+                for ending in _RE_SENTENCE.finditer(current_sentence):
+                    yield ending.group().strip()
+                    end = ending.end()
                 # Keep any remaining text that doesn't end with punctuation
-                remaining = re.sub(r'[^.!?]*[.!?]+', '', current_sentence)
-                current_sentence = remaining.strip()
+                current_sentence = current_sentence[end:].strip()
         
         # Add any remaining text
         if current_sentence.strip():
-            sentences.append(current_sentence.strip())
+            yield current_sentence.strip()
+    
+    def _flatten_html_lxml(self, html_content: str) -> str:
+        """Flatten article HTML to marked-up plain text using lxml"""
+        root = lxml_html.document_fromstring(html_content)
+        body = root.find('body')
+        if body is None:
+            body = root
         
-        # Join sentences with double line breaks for RF readability
-        formatted_content = ""
-        for sentence in sentences:
-            if sentence.strip():
-                formatted_content += sentence.strip() + "\n\n"
+        # Remove script and style elements (drop_tree keeps their tail text)
+        for element in list(body.iter('script', 'style')):
+            element.drop_tree()
         
-        return formatted_content.strip()
+        # Convert headers to text format
+        for element in list(body.iter(*HEADER_TAGS)):
+            title = element.text_content()
+            for child in list(element):
+                element.remove(child)
+            element.text = f"\n\n\n=== {title} ===\n\n"
+        
+        # Paragraphs, line breaks and lists become blank-line separated blocks
+        for element in body.iter('p', 'br', 'li', 'ul', 'ol'):
+            tag = element.tag
+            if tag == 'p':
+                element.text = '\n\n' + (element.text or '')
+            elif tag == 'br':
+                element.tail = '\n\n' + (element.tail or '')
+            elif tag == 'li':
+                element.text = '\n\n• ' + (element.text or '')
+            else:
+                element.text = '\n\n' + (element.text or '')
+                element.tail = '\n\n' + (element.tail or '')
+        
+        # text_content() drops the remaining tags and has already decoded
+        # every entity; only the non-breaking spaces need folding
+        return body.text_content().replace('\xa0', ' ')
+    
+    def _flatten_html_regex(self, html_content: str) -> str:
+        """Flatten article HTML to marked-up plain text using regexes"""
+        # Remove script and style elements
+        html_content = _RE_SCRIPT_STYLE.sub('', html_content)
+        
+        # Convert headers to text format
+        html_content = _RE_HEADER.sub(r'\n\n\n=== \2 ===\n\n', html_content)
+        
+        # Paragraphs, line breaks and lists become blank-line breaks,
+        # list items become bullets; their closing tags are dropped
+        html_content = _RE_BLOCK_BREAK.sub('\n\n', html_content)
+        html_content = _RE_LI_OPEN.sub('\n\n• ', html_content)
+        html_content = _RE_BLOCK_CLOSE.sub('', html_content)
+        
+        # Remove all remaining HTML tags
+        html_content = _RE_TAG.sub('', html_content)
+        
+        # Decode HTML entities in one pass - every named and numeric entity,
+        # as the lxml path does - and fold non-breaking spaces like it too
+        html_content = html.unescape(html_content).replace('\xa0', ' ')
+        
+        return html_content
     
     def get_suggestions(self, partial_query: str, max_results: int = 5) -> List[str]:
         """Get article title suggestions for partial queries"""
@@ -741,18 +873,26 @@ class WikiZimReader:
             suggestions_result = self.suggestion_searcher.suggest(partial_query)
             results = []
             
+            # Bound once; both loops below run per suggestion
+            safe_get = self._safe_get_attribute
+            append = results.append
+            
             # Handle different suggestion result formats
             if hasattr(suggestions_result, 'size'):
                 try:
                     size = suggestions_result.size()
+                    get_result = suggestions_result.get_result
                     for i in range(min(max_results, size)):
                         try:
-                            entry = suggestions_result.get_result(i)
-                            title = self._safe_get_attribute(entry, 'title', str(entry))
+                            entry = get_result(i)
+                            # str(entry) is only built for entries without a title
+                            title = safe_get(entry, 'title', None)
+                            if title is None:
+                                title = str(entry)
                             if title:
-                                results.append(title)
+                                append(title)
                         except Exception as e:
-                            print(f"Warning: Error getting suggestion {i}: {e}")
+                            log.debug("Error getting suggestion %d: %s", i, e)
                             continue
                 except Exception as e:
                     print(f"Error using size() method: {e}")
@@ -760,12 +900,12 @@ class WikiZimReader:
             # Try iteration if size method failed
             if not results and hasattr(suggestions_result, '__iter__'):
                 try:
-                    for i, entry in enumerate(suggestions_result):
-                        if i >= max_results:
-                            break
-                        title = self._safe_get_attribute(entry, 'title', str(entry))
+                    for entry in islice(suggestions_result, max_results):
+                        title = safe_get(entry, 'title', None)
+                        if title is None:
+                            title = str(entry)
                         if title:
-                            results.append(title)
+                            append(title)
                 except Exception as e:
                     print(f"Error iterating suggestions: {e}")
             
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
-import urllib.request
+import io
+import requests
 import xml.etree.ElementTree as ET
 import re
 import sys
+import time
 import unicodedata
 
 ALERT = False
@@ -27,17 +29,43 @@ CITIES = {
     "Chibougamau":"49.915_-74.373_"
 }
 
+# Menu order and the full menu text, built once
+_CITY_NAMES = tuple(CITIES)
+_MENU_TEXT = ("\n=== Weather Quebec Forecast Menu ===\n"
+              "Select a city to view the alert and weather forecast:\n"
+              + "".join(f"{i}. {city}\n" for i, city in enumerate(_CITY_NAMES, 1))
+              + "0. Exit\n"
+              "===========================\n")
+
+# Shared keep-alive session: picking another city reuses the open HTTPS
+# connection to meteo.gc.ca instead of a new TCP + TLS handshake each time
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip", "User-Agent": "emcomm-bbs-wqf/1.0"})
+
+# Fully qualified title/description tags per item namespace, so find()
+# never has to expand a {*} wildcard
+_ITEM_TAGS = {}
+
+# Feeds already fetched, keyed by (info, lang, url):
+# (fetched_at, body, etag, last_modified). At most one entry per city,
+# report type and language, so it needs no eviction
+_RSS_CACHE = {}
+
+# Seconds a fetched feed is reused without asking the server again;
+# meteo.gc.ca updates its feeds at most every ~10 minutes
+RSS_CACHE_TTL = 300
+
+# Accepted replies to the start-up questions, in the order a reply
+# containing several of them is resolved
+_LANG = {"f": "f", "e": "e"}
+_YN = {"y": True, "n": False}
+
+# HTML tags inside item descriptions, compiled once
+_RE_TAG = re.compile(r'<[^>]+>')
+
 def display_menu():
     """Display the city selection menu"""
-    print("\n=== Weather Quebec Forecast Menu ===")
-    print("Select a city to view the alert and weather forecast:")
-    
-    # Display numbered options
-    for i, city in enumerate(CITIES.keys(), 1):
-        print(f"{i}. {city}")
-    
-    print("0. Exit")
-    print("===========================")
+    sys.stdout.write(_MENU_TEXT)
 
 def get_menu_choice():
     """Get user choice from the menu"""
@@ -57,6 +85,10 @@ def convert_to_ascii(text):
     """Convert Unicode text with accents to ASCII equivalent"""
     if text is None:
         return ""
+    
+    # English forecasts are usually plain ASCII already
+    if text.isascii():
+        return text
         
     # Normalize to decomposed form (separate base characters from accents)
     normalized = unicodedata.normalize('NFKD', text)
@@ -65,6 +97,117 @@ def convert_to_ascii(text):
     ascii_text = normalized.encode('ASCII', 'ignore').decode('ASCII')
     return ascii_text
 
+def _item_tags(ns):
+    """Title and description tags to try for items in namespace ns ('' or '{uri}')"""
+    tags = _ITEM_TAGS.get(ns)
+    if tags is None:
+        title_tags = ('title',)
+        desc_tags = ('description', 'summary', 'content')
+        if ns:
+            title_tags += (ns + 'title',)
+            desc_tags += tuple(ns + tag for tag in desc_tags)
+        tags = _ITEM_TAGS[ns] = (title_tags, desc_tags)
+    return tags
+
+def print_weather_item(item, ns=''):
+    """Print the title and plain-text description of one RSS item or Atom entry"""
+    title_tags, desc_tags = _item_tags(ns)
+    
+    # Try different possible tag names for title and description
+    title = None
+    for title_tag in title_tags:
+        title_elem = item.find(title_tag)
+        if title_elem is not None and title_elem.text:
+            title = title_elem.text
+            break
+    
+    description = None
+    for desc_tag in desc_tags:
+        desc_elem = item.find(desc_tag)
+        if desc_elem is not None and desc_elem.text:
+            description = desc_elem.text
+            break
+    
+    if title or description:
+        # Collect the item's lines and send them in a single write
+        out = []
+        if title:
+            out.append(f"\n{title}")
+        
+        if description:
+            # Clean HTML tags
+            clean_description = _RE_TAG.sub(' ', description)
+            # Remove extra whitespace
+            clean_description = ' '.join(clean_description.split())
+            # Convert to ASCII
+            # clean_description = convert_to_ascii(clean_description)
+            out.append(clean_description)
+        
+        out.append("-" * 40)
+        sys.stdout.write("\n".join(out) + "\n")
+
+class _RecordingReader:
+    """File-like wrapper that keeps a copy of everything read through it"""
+    def __init__(self, raw):
+        self.raw = raw
+        self.chunks = []
+    
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.chunks.append(data)
+        return data
+
+def print_weather_feed(source):
+    """Print the header and items of an RSS/Atom feed read from source; True if it had items"""
+    found_items = False
+    
+    # Stream the feed: each item is printed as soon as its closing tag
+    # has been parsed (often before the download finishes) and then
+    # cleared, so the whole document is never held in memory
+    open_tags = []          # tags of the elements currently open
+    in_channel = False      # inside a standard (un-namespaced) RSS channel
+    header_done = False     # channel header separator printed
+    # Full tag -> (local name, '{namespace}' prefix), split once per
+    # distinct tag rather than on every start and end event
+    tag_names = {}
+    
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        names = tag_names.get(elem.tag)
+        if names is None:
+            local = elem.tag.rsplit('}', 1)[-1]
+            names = tag_names[elem.tag] = (local, elem.tag[:-len(local)])
+        local_tag, ns = names
+        
+        if event == 'start':
+            if elem.tag == 'channel':
+                in_channel = True
+            elif local_tag in ('item', 'entry') and in_channel and not header_done:
+                sys.stdout.write("-" * 60 + "\n")
+                header_done = True
+            open_tags.append(elem.tag)
+            continue
+        
+        open_tags.pop()
+        
+        if local_tag in ('item', 'entry'):
+            print_weather_item(elem, ns)
+            found_items = True
+            elem.clear()
+        elif elem.tag == 'channel':
+            if not header_done:
+                sys.stdout.write("-" * 60 + "\n")
+                header_done = True
+            in_channel = False
+        elif in_channel and open_tags and open_tags[-1] == 'channel':
+            # Channel title and description make up the header
+            if elem.tag == 'title':
+                sys.stdout.write(f"\n{elem.text}\n\n")
+            elif elem.tag == 'description':
+                sys.stdout.write(f"{elem.text}\n\n")
+    
+    sys.stdout.flush()
+    return found_items
+
 def parse_weather_rss(info, lang, url, city_name):
     """
     Fetches weather data from the provided RSS URL and returns it as plain text.
@@ -76,79 +219,38 @@ def parse_weather_rss(info, lang, url, city_name):
         # Fetch the RSS contentprint(f"The lang selected is : {LANG}")
         fullurl = f"https://meteo.gc.ca/rss/{info}/{url}{lang}.xml";
         
-        with urllib.request.urlopen(fullurl) as response:
-            rss_content = response.read()
-        
-        # Parse the XML
-        root = ET.fromstring(rss_content)
-        
-        # Find items regardless of structure
-        items = []
-        
-        # Try to find channel first (standard RSS)
-        channel = root.find('.//channel')
+        key = (info, lang, url)
+        cached = _RSS_CACHE.get(key)
+        now = time.time()
         
-        if channel is not None:
-            title_elem = channel.find('title')
-            desc_elem = channel.find('description')
-            
-            if title_elem is not None:
-                print(f"\n{title_elem.text}\n")
-            
-            if desc_elem is not None:
-                print(f"{desc_elem.text}\n")
-            
-            print("-" * 60)
-            
-            # Get items from channel
-            items = channel.findall('item')
+        if cached and now - cached[0] < RSS_CACHE_TTL:
+            # Fetched moments ago; the feed won't have changed yet
+            found_items = print_weather_feed(io.BytesIO(cached[1]))
         else:
-            # If no channel, try to find items directly
-            # Try with namespace
-            items = root.findall('.//{*}item')
-            if not items:
-                # Try without namespace
-                items = root.findall('.//item')
-            
-            # If still no items, try entries (for Atom feeds)
-            if not items:
-                items = root.findall('.//{*}entry')
-                if not items:
-                    items = root.findall('.//entry')
-        
-        # Process each found item
-        for item in items:
-            # Try different possible tag names for title and description
-            title = None
-            for title_tag in ['title', '{*}title']:
-                title_elem = item.find(title_tag)
-                if title_elem is not None and title_elem.text:
-                    title = title_elem.text
-                    break
-            
-            description = None
-            for desc_tag in ['description', 'summary', 'content', '{*}description', '{*}summary', '{*}content']:
-                desc_elem = item.find(desc_tag)
-                if desc_elem is not None and desc_elem.text:
-                    description = desc_elem.text
-                    break
+            # Revalidate a stale copy instead of downloading it again
+            headers = {}
+            if cached and cached[2]:
+                headers["If-None-Match"] = cached[2]
+            if cached and cached[3]:
+                headers["If-Modified-Since"] = cached[3]
             
-            if title or description:
-                if title:
-                    print(f"\n{title}")
-                
-                if description:
-                    # Clean HTML tags
-                    clean_description = re.sub(r'<[^>]+>', ' ', description)
-                    # Remove extra whitespace
-                    clean_description = ' '.join(clean_description.split())
-                    # Convert to ASCII
-                    # clean_description = convert_to_ascii(clean_description)
-                    print(f"{clean_description}")
-                
-                print("-" * 40)
-        
-        if not items:
+            with _SESSION.get(fullurl, stream=True, timeout=30, headers=headers) as response:
+                if cached and response.status_code == 304:
+                    _RSS_CACHE[key] = (now,) + cached[1:]
+                    found_items = print_weather_feed(io.BytesIO(cached[1]))
+                else:
+                    response.raise_for_status()
+                    # Let urllib3 undo the gzip transfer encoding as the parser reads
+                    response.raw.decode_content = True
+                    
+                    source = _RecordingReader(response.raw)
+                    found_items = print_weather_feed(source)
+                    # Only a feed that parsed all the way through is cached
+                    _RSS_CACHE[key] = (now, b"".join(source.chunks),
+                                       response.headers.get("ETag"),
+                                       response.headers.get("Last-Modified"))
+        
+        if not found_items:
             print("No weather items found in the feed.")
             
     except Exception as e:
@@ -156,54 +258,29 @@ def parse_weather_rss(info, lang, url, city_name):
         import traceback
         traceback.print_exc()
 
-def SetLang():
-    
+def _prompt(question, prompt, answers, complaint):
+    """Ask until the reply is, or contains, one of the answers keys; return its value"""
     while True:
-       try:
-            print("\nSelect the weather report language: 'E' for English or 'F' for Français")
-
-            lang = input("\nLanguage Report: ")
-            lang = lang.strip().lower()
-            
-            #print(f"\nThe lang selected is : {lang}")
-            
-            #print(f"ASCII values: {[ord(c) for c in lang]}")
-            
-            if lang == "f" or lang == "e":
-                return lang
-            elif "f" in lang:
-                print("Found 'f' in input, returning 'f'")
-                return "f"
-            elif "e" in lang:
-                print("Found 'e' in input, returning 'e'")
-                return "e"
-            else:
-                print(f"\nNot good letter '{lang}' ...")
-                
-       except ValueError:
-            print("Please enter a valid letter.")
-            
-def IsAlertOnly():                
-    while True:
-       try:
-            print("\nDo you want to read the Alerts only ? 'Y' for YES or 'N' for No")
+        print(question)
+        
+        reply = input(prompt).strip().lower()
+        
+        if reply in answers:
+            return answers[reply]
+        # Fall back to the first key found anywhere in the reply
+        for key, value in answers.items():
+            if key in reply:
+                return value
+        
+        print(f"\n{complaint} '{reply}' ...")
 
-            alert = input("\nAlert only: ")
-            alert = alert.strip().lower()
+def SetLang():
+    return _prompt("\nSelect the weather report language: 'E' for English or 'F' for Français",
+                   "\nLanguage Report: ", _LANG, "Not good letter")
             
-            if alert == "y":
-                return True
-            elif alert == "n":
-                return False
-            elif "y" in alert:
-                return True
-            elif "n" in alert:
-                return False
-            else:
-                print(f"\nNot good answer '{lang}' ...")
-                
-       except ValueError:
-            print("Please enter a valid letter.")   
+def IsAlertOnly():
+    return _prompt("\nDo you want to read the Alerts only ? 'Y' for YES or 'N' for No",
+                   "\nAlert only: ", _YN, "Not good answer")
    
    
 def main():
@@ -222,7 +299,7 @@ def main():
             sys.exit(0)
         
         # Get the selected city and URL
-        city_name = list(CITIES.keys())[choice - 1]
+        city_name = _CITY_NAMES[choice - 1]
         city_url = CITIES[city_name]
         
         # Parse and display the weather for the selected city